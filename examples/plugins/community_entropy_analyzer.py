@@ -8,8 +8,111 @@ Contributed by the community.
 from ghidrainsight.plugins import BaseAnalyzer, AnalysisResult
 from typing import Dict, Any, Optional, List
 import time
-from collections import Counter
-import math
+
+import numpy as np
+
+try:
+    from numba import config as numba_config, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Regions listed per entropy finding; the rest are only counted
+MAX_REPORTED_REGIONS = 10
+
+# CLOG[c] = c * log2(c), shared by every window size. A window of W bytes
+# with byte histogram h has entropy log2(W) - sum(CLOG[h]) / W; for the
+# default power-of-two W the log2 term and the division are exact.
+_CLOG_TABLE = np.zeros(1, dtype=np.float64)
+
+
+def _build_clog(max_count: int) -> np.ndarray:
+    """Return the CLOG table covering counts in [0, max_count]."""
+    global _CLOG_TABLE
+    if len(_CLOG_TABLE) <= max_count:
+        counts = np.arange(1, max_count + 1, dtype=np.float64)
+        table = np.zeros(max_count + 1, dtype=np.float64)
+        table[1:] = counts * np.log2(counts)
+        _CLOG_TABLE = table
+    return _CLOG_TABLE
+
+
+def _scan_window_entropies_numpy(
+    arr: np.ndarray, window_size: int, step_size: int, clog: np.ndarray
+) -> np.ndarray:
+    """Compute the entropy of every sliding window using NumPy histograms."""
+    offsets = range(0, len(arr) - window_size, step_size)
+    entropies = np.empty(len(offsets), dtype=np.float64)
+    
+    # The histogram is rolled forward incrementally: each step drops the
+    # outgoing step_size bytes and adds the incoming ones instead of
+    # recounting the whole window.
+    log2_window = np.log2(window_size)
+    hist = np.bincount(arr[:window_size], minlength=256).astype(np.int64)
+    for k, i in enumerate(offsets):
+        if i:
+            hist += np.bincount(arr[i - step_size + window_size:i + window_size], minlength=256)
+            hist -= np.bincount(arr[i - step_size:i], minlength=256)
+        entropies[k] = log2_window - clog[hist].sum() / window_size
+    
+    return entropies
+
+
+if NUMBA_AVAILABLE:
+    # No on-disk cache: PluginLoader imports plugins under a throwaway module
+    # name, and numba cannot reload cached kernels whose module it cannot import
+    @njit
+    def _scan_window_entropies_serial(arr, window_size, step_size, clog):
+        """Compute the entropy of every sliding window in one compiled pass."""
+        n_windows = (len(arr) - window_size + step_size - 1) // step_size
+        entropies = np.empty(max(n_windows, 0), dtype=np.float64)
+        log2_window = np.log2(window_size)
+        hist = np.zeros(256, dtype=np.int64)
+        
+        for j in range(window_size):
+            hist[arr[j]] += 1
+        
+        for k in range(n_windows):
+            i = k * step_size
+            if k:
+                for j in range(i - step_size + window_size, i + window_size):
+                    hist[arr[j]] += 1
+                for j in range(i - step_size, i):
+                    hist[arr[j]] -= 1
+            total = 0.0
+            for b in range(256):
+                total += clog[hist[b]]
+            entropies[k] = log2_window - total / window_size
+        
+        return entropies
+    
+    @njit(parallel=True)
+    def _scan_window_entropies_parallel(arr, window_size, step_size, clog):
+        """Compute window entropies across threads, counting each window independently."""
+        n_windows = (len(arr) - window_size + step_size - 1) // step_size
+        entropies = np.empty(max(n_windows, 0), dtype=np.float64)
+        log2_window = np.log2(window_size)
+        
+        for k in prange(n_windows):
+            hist = np.zeros(256, dtype=np.int64)
+            for j in range(k * step_size, k * step_size + window_size):
+                hist[arr[j]] += 1
+            total = 0.0
+            for b in range(256):
+                total += clog[hist[b]]
+            entropies[k] = log2_window - total / window_size
+        
+        return entropies
+    
+    # Independent windows trade the rolling histogram for parallelism, which
+    # only pays off when numba has more than one thread to work with
+    if numba_config.NUMBA_NUM_THREADS > 1:
+        _scan_window_entropies = _scan_window_entropies_parallel
+    else:
+        _scan_window_entropies = _scan_window_entropies_serial
+else:
+    _scan_window_entropies = _scan_window_entropies_numpy
 
 
 class EntropyAnalyzer(BaseAnalyzer):
@@ -40,7 +143,12 @@ class EntropyAnalyzer(BaseAnalyzer):
         start_time = time.time()
         findings: List[Dict[str, Any]] = []
         
-        if len(binary_data) < self.config.get("window_size", 256):
+        window_size = self.config.get("window_size", 256)
+        step_size = self.config.get("step_size", 128)
+        high_threshold = self.config.get("high_entropy_threshold", 7.5)
+        very_high_threshold = self.config.get("very_high_entropy_threshold", 7.9)
+        
+        if len(binary_data) < window_size:
             return self._create_result(
                 findings=[],
                 metadata={"error": "Binary too small for entropy analysis"},
@@ -48,53 +156,43 @@ class EntropyAnalyzer(BaseAnalyzer):
                 confidence=0.0
             )
         
-        window_size = self.config.get("window_size", 256)
-        step_size = self.config.get("step_size", 128)
-        high_threshold = self.config.get("high_entropy_threshold", 7.5)
-        very_high_threshold = self.config.get("very_high_entropy_threshold", 7.9)
+        # Single zero-copy uint8 view shared by every window (and by other
+        # analyzers run with the same context)
+        arr = self._uint8_view(binary_data, context)
         
-        high_entropy_regions = []
-        very_high_entropy_regions = []
-        
-        # Calculate entropy for sliding windows
-        for i in range(0, len(binary_data) - window_size, step_size):
-            window = binary_data[i:i + window_size]
-            entropy = self._calculate_entropy(window)
-            
-            if entropy >= very_high_threshold:
-                very_high_entropy_regions.append({
-                    "offset": i,
-                    "entropy": round(entropy, 2),
-                    "size": window_size,
-                })
-            elif entropy >= high_threshold:
-                high_entropy_regions.append({
-                    "offset": i,
-                    "entropy": round(entropy, 2),
-                    "size": window_size,
-                })
+        # Calculate entropy for sliding windows. Every window holds exactly
+        # window_size bytes, so per-count entropy terms come from a lookup
+        # table instead of log2 calls.
+        entropies = _scan_window_entropies(arr, window_size, step_size, _build_clog(window_size))
+        
+        # Classify all windows at once; region dicts are only built for the
+        # windows that are actually reported
+        very_high_mask = entropies >= very_high_threshold
+        high_mask = (entropies >= high_threshold) & ~very_high_mask
+        very_high_count = int(np.count_nonzero(very_high_mask))
+        high_count = int(np.count_nonzero(high_mask))
         
         # Create findings
-        if very_high_entropy_regions:
+        if very_high_count:
             findings.append({
                 "type": "very_high_entropy",
-                "regions": very_high_entropy_regions[:10],  # Limit to 10
-                "count": len(very_high_entropy_regions),
+                "regions": self._regions(entropies, very_high_mask, window_size, step_size),
+                "count": very_high_count,
                 "severity": "high",
-                "description": f"Found {len(very_high_entropy_regions)} regions with very high entropy (>= {very_high_threshold}). Possible encryption or packing.",
+                "description": f"Found {very_high_count} regions with very high entropy (>= {very_high_threshold}). Possible encryption or packing.",
             })
         
-        if high_entropy_regions:
+        if high_count:
             findings.append({
                 "type": "high_entropy",
-                "regions": high_entropy_regions[:10],  # Limit to 10
-                "count": len(high_entropy_regions),
+                "regions": self._regions(entropies, high_mask, window_size, step_size),
+                "count": high_count,
                 "severity": "medium",
-                "description": f"Found {len(high_entropy_regions)} regions with high entropy (>= {high_threshold}). Possible compression or obfuscation.",
+                "description": f"Found {high_count} regions with high entropy (>= {high_threshold}). Possible compression or obfuscation.",
             })
         
         # Overall entropy
-        overall_entropy = self._calculate_entropy(binary_data)
+        overall_entropy = self._calculate_entropy(arr)
         findings.append({
             "type": "overall_entropy",
             "entropy": round(overall_entropy, 2),
@@ -115,20 +213,32 @@ class EntropyAnalyzer(BaseAnalyzer):
             confidence=0.85
         )
     
-    def _calculate_entropy(self, data: bytes) -> float:
-        """Calculate Shannon entropy of data."""
+    def _regions(
+        self, entropies: np.ndarray, mask: np.ndarray, window_size: int, step_size: int
+    ) -> List[Dict[str, Any]]:
+        """Build region entries for the first MAX_REPORTED_REGIONS windows selected by mask."""
+        return [
+            {
+                "offset": index * step_size,
+                "entropy": round(float(entropies[index]), 2),
+                "size": window_size,
+            }
+            for index in np.flatnonzero(mask)[:MAX_REPORTED_REGIONS].tolist()
+        ]
+    
+    def _calculate_entropy(self, data: np.ndarray) -> float:
+        """Calculate Shannon entropy of a uint8 array."""
         if len(data) == 0:
             return 0.0
         
-        byte_counts = Counter(data)
-        entropy = 0.0
-        
-        for count in byte_counts.values():
-            probability = count / len(data)
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
+        return self._entropy_from_counts(np.bincount(data, minlength=256))
+    
+    def _entropy_from_counts(self, counts: np.ndarray) -> float:
+        """Calculate Shannon entropy from a 256-bin byte histogram."""
+        nonzero = counts[counts > 0].astype(np.float64)
+        probabilities = nonzero / nonzero.sum()
         
-        return entropy
+        return float(-(probabilities * np.log2(probabilities)).sum())
     
     def validate(self) -> bool:
         """Validate plugin configuration."""
@@ -6,10 +6,83 @@ Contributed by the community.
 """
 
 from ghidrainsight.plugins import BaseAnalyzer, AnalysisResult
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
+from bisect import bisect_right
 import time
 import re
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Common API key patterns
+API_KEY_PATTERNS = {
+    "aws_key": rb"AKIA[0-9A-Z]{16}",
+    "github_token": rb"ghp_[a-zA-Z0-9]{36}",
+    "slack_token": rb"xox[baprs]-[0-9a-zA-Z-]{10,}",
+    "jwt": rb"eyJ[A-Za-z0-9-_=]+\.eyJ[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*",
+}
+
+SENSITIVE_PATHS = [
+    "/etc/passwd", "/etc/shadow", "/etc/hosts",
+    "C:\\Windows\\System32", "C:\\Windows\\Temp",
+    "/tmp/", "/var/log/", ".ssh/", ".aws/",
+]
+
+# No path shorter than this can contain a sensitive path
+MIN_SENSITIVE_PATH_LENGTH = min(len(path) for path in SENSITIVE_PATHS)
+
+SUSPICIOUS_DOMAINS = ["pastebin.com", "paste.ee", "hastebin.com"]
+
+SUSPICIOUS_KEYWORDS = [
+    "password", "secret", "key", "token", "credential",
+    "backdoor", "trojan", "malware", "exploit",
+    "cmd.exe", "/bin/sh", "powershell",
+]
+
+# Offsets reported per grouped finding
+MAX_SAMPLES = 10
+
+StringRuns = Tuple[List[int], List[int]]
+
+# Keeps printable ASCII bytes and maps everything else to NUL
+_NONPRINT_TABLE = bytes(byte if 32 <= byte <= 126 else 0 for byte in range(256))
+
+
+def _keyword_matcher(keywords: List[str]) -> "re.Pattern[bytes]":
+    """Compile lowercase literals into one alternation that also reports overlapping hits."""
+    alternation = b"|".join(re.escape(keyword.lower().encode("ascii")) for keyword in keywords)
+    return re.compile(b"(?=(" + alternation + b"))")
+
+
+def _run_index(runs: StringRuns, offset: int) -> int:
+    """Return the index of the string containing offset, or -1 if there is none."""
+    starts, ends = runs
+    index = bisect_right(starts, offset) - 1
+    if index >= 0 and offset < ends[index]:
+        return index
+    return -1
+
+
+def _group_hits(hits: Iterable[Tuple[int, str, int]]) -> Dict[str, Dict[str, Any]]:
+    """Group (string index, key, offset) hits by key, counting each string once."""
+    groups: Dict[str, Dict[str, Any]] = {}
+    last_index: Dict[str, int] = {}
+    
+    for index, key, offset in hits:
+        if last_index.get(key) == index:
+            continue
+        last_index[key] = index
+        group = groups.setdefault(key, {"count": 0, "offsets": []})
+        group["count"] += 1
+        if len(group["offsets"]) < MAX_SAMPLES:
+            group["offsets"].append(offset)
+    
+    return groups
+
 
 class StringAnalyzer(BaseAnalyzer):
     """
@@ -33,32 +106,59 @@ class StringAnalyzer(BaseAnalyzer):
             "check_urls": True,
             "check_paths": True,
         }
+        
+        # One scan of the buffer covers every pattern; the lookahead keeps
+        # matches of different types from shadowing each other.
+        self._api_key_re = re.compile(
+            b"|".join(
+                b"(?=(?P<" + name.encode("ascii") + b">" + pattern + b"))"
+                for name, pattern in API_KEY_PATTERNS.items()
+            ),
+            re.IGNORECASE,
+        )
+        self._sensitive_path_re = _keyword_matcher(SENSITIVE_PATHS)
+        self._suspicious_domain_re = _keyword_matcher(SUSPICIOUS_DOMAINS)
+        self._suspicious_re = _keyword_matcher(SUSPICIOUS_KEYWORDS)
+        
+        # Character classes exclude non-printable bytes so matches never span two strings
+        self._url_re = re.compile(rb"https?://[^\x00-\x20\x7f-\xff<>\"{}|\\^`\[\]]+")
+        self._win_path_re = re.compile(
+            rb"[A-Za-z]:\\(?:[^\\/:*?\"<>|\x00-\x1f\x7f-\xff]+\\)*"
+            rb"[^\\/:*?\"<>|\x00-\x1f\x7f-\xff]*"
+        )
+        self._unix_path_re = re.compile(rb"/(?:[^/\x00-\x1f\x7f-\xff]+/)*[^/\x00-\x1f\x7f-\xff]+")
     
     def analyze(self, binary_data: bytes, context: Optional[Dict[str, Any]] = None) -> AnalysisResult:
         """Analyze strings in binary."""
         start_time = time.time()
         findings: List[Dict[str, Any]] = []
         
-        # Extract strings
-        strings = self._extract_strings(binary_data)
+        # The scans below rely on bytes methods and bytes containment, which
+        # memoryview and other buffers do not provide
+        if not isinstance(binary_data, bytes):
+            binary_data = bytes(binary_data)
+        
+        # Locate strings; the checks below scan binary_data directly and only
+        # keep matches that fall inside one of these printable runs.
+        runs = self._extract_strings(binary_data, context)
         
         # Check for API keys
         if self.config.get("check_api_keys", True):
-            api_key_findings = self._check_api_keys(strings)
+            api_key_findings = self._check_api_keys(binary_data, runs)
             findings.extend(api_key_findings)
         
         # Check for URLs
         if self.config.get("check_urls", True):
-            url_findings = self._check_urls(strings)
+            url_findings = self._check_urls(binary_data, runs)
             findings.extend(url_findings)
         
         # Check for file paths
         if self.config.get("check_paths", True):
-            path_findings = self._check_paths(strings)
+            path_findings = self._check_paths(binary_data, runs)
             findings.extend(path_findings)
         
         # Check for suspicious strings
-        suspicious_findings = self._check_suspicious(strings)
+        suspicious_findings = self._check_suspicious(binary_data, runs)
         findings.extend(suspicious_findings)
         
         execution_time = (time.time() - start_time) * 1000
@@ -66,144 +166,158 @@ class StringAnalyzer(BaseAnalyzer):
         return self._create_result(
             findings=findings,
             metadata={
-                "total_strings": len(strings),
-                "strings_analyzed": len(strings),
+                "total_strings": len(runs[0]),
+                "strings_analyzed": len(runs[0]),
             },
             execution_time_ms=execution_time,
             confidence=0.80
         )
     
-    def _extract_strings(self, binary_data: bytes) -> List[str]:
-        """Extract printable strings from binary."""
-        strings = []
-        current_string = b""
-        
-        for byte in binary_data:
-            if 32 <= byte <= 126:  # Printable ASCII
-                current_string += bytes([byte])
-            else:
-                if len(current_string) >= self.config.get("min_string_length", 4):
-                    try:
-                        strings.append(current_string.decode('ascii', errors='ignore'))
-                    except:
-                        pass
-                current_string = b""
-        
-        # Add last string if exists
-        if len(current_string) >= self.config.get("min_string_length", 4):
-            try:
-                strings.append(current_string.decode('ascii', errors='ignore'))
-            except:
-                pass
-        
-        return strings
+    def _extract_strings(self, binary_data: bytes, context: Optional[Dict[str, Any]] = None) -> StringRuns:
+        """Locate printable strings in binary as (starts, ends) byte offsets."""
+        if not NUMPY_AVAILABLE:
+            return self._extract_strings_fallback(binary_data)
+        
+        min_len = self.config.get("min_string_length", 4)
+        
+        # Reuse the uint8 view another analyzer cached on the shared context
+        arr = self._uint8_view(binary_data, context)
+        if len(arr) == 0:
+            return [], []
+        
+        # Printable ASCII mask; run boundaries are where the mask flips
+        mask = (arr >= 32) & (arr <= 126)
+        starts = np.flatnonzero(np.r_[mask[0], ~mask[:-1] & mask[1:]])
+        ends = np.flatnonzero(np.r_[mask[:-1] & ~mask[1:], mask[-1]]) + 1
+        keep = (ends - starts) >= min_len
+        
+        return starts[keep].tolist(), ends[keep].tolist()
+    
+    def _extract_strings_fallback(self, binary_data: bytes) -> StringRuns:
+        """Locate printable strings in binary without NumPy."""
+        min_len = self.config.get("min_string_length", 4)
+        
+        # Map every non-printable byte to NUL in C, then let the regex engine
+        # find the long-enough runs instead of looping over bytes in Python
+        normalized = bytes(binary_data).translate(_NONPRINT_TABLE)
+        matches = list(re.finditer(rb"[^\x00]{%d,}" % min_len, normalized))
+        
+        return [match.start() for match in matches], [match.end() for match in matches]
     
-    def _check_api_keys(self, strings: List[str]) -> List[Dict[str, Any]]:
+    def _check_api_keys(self, binary_data: bytes, runs: StringRuns) -> List[Dict[str, Any]]:
         """Check for API keys and tokens."""
         findings = []
         
-        # Common API key patterns
-        patterns = {
-            "aws_key": r"AKIA[0-9A-Z]{16}",
-            "github_token": r"ghp_[a-zA-Z0-9]{36}",
-            "slack_token": r"xox[baprs]-[0-9a-zA-Z-]{10,}",
-            "jwt": r"eyJ[A-Za-z0-9-_=]+\.eyJ[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*",
-        }
+        matches = (
+            (_run_index(runs, match.start()), match.lastgroup, match.start())
+            for match in self._api_key_re.finditer(binary_data)
+        )
+        groups = _group_hits(hit for hit in matches if hit[0] >= 0)
         
-        for string in strings:
-            for key_type, pattern in patterns.items():
-                if re.search(pattern, string, re.IGNORECASE):
-                    findings.append({
-                        "type": "api_key_detected",
-                        "key_type": key_type,
-                        "severity": "high",
-                        "description": f"Potential {key_type} found in binary",
-                        "location": "strings",
-                    })
+        # One finding per key type
+        for key_type in API_KEY_PATTERNS:
+            if key_type in groups:
+                findings.append({
+                    "type": "api_key_detected",
+                    "key_type": key_type,
+                    "count": groups[key_type]["count"],
+                    "offsets": groups[key_type]["offsets"],
+                    "severity": "high",
+                    "description": f"Potential {key_type} found in binary",
+                    "location": "strings",
+                })
         
         return findings
     
-    def _check_urls(self, strings: List[str]) -> List[Dict[str, Any]]:
+    def _check_urls(self, binary_data: bytes, runs: StringRuns) -> List[Dict[str, Any]]:
         """Check for URLs."""
         findings = []
         
-        url_pattern = r"https?://[^\s<>\"{}|\\^`\[\]]+"
-        
-        for string in strings:
-            urls = re.findall(url_pattern, string)
-            for url in urls:
-                # Check for suspicious URLs
-                if any(domain in url.lower() for domain in ["pastebin.com", "paste.ee", "hastebin.com"]):
-                    findings.append({
-                        "type": "suspicious_url",
-                        "url": url,
-                        "severity": "medium",
-                        "description": f"Suspicious URL found: {url}",
-                        "location": "strings",
-                    })
-                elif "api" in url.lower() or "endpoint" in url.lower():
-                    findings.append({
-                        "type": "api_endpoint",
-                        "url": url,
-                        "severity": "low",
-                        "description": f"API endpoint found: {url}",
-                        "location": "strings",
-                    })
+        for match in self._url_re.finditer(binary_data):
+            if _run_index(runs, match.start()) < 0:
+                continue
+            url = match.group().decode("ascii")
+            url_lower = match.group().lower()
+            # Check for suspicious URLs
+            if self._suspicious_domain_re.search(url_lower):
+                findings.append({
+                    "type": "suspicious_url",
+                    "url": url,
+                    "severity": "medium",
+                    "description": f"Suspicious URL found: {url}",
+                    "location": "strings",
+                    "offset": match.start(),
+                })
+            elif b"api" in url_lower or b"endpoint" in url_lower:
+                findings.append({
+                    "type": "api_endpoint",
+                    "url": url,
+                    "severity": "low",
+                    "description": f"API endpoint found: {url}",
+                    "location": "strings",
+                    "offset": match.start(),
+                })
         
         return findings
     
-    def _check_paths(self, strings: List[str]) -> List[Dict[str, Any]]:
+    def _check_paths(self, binary_data: bytes, runs: StringRuns) -> List[Dict[str, Any]]:
         """Check for file paths."""
         findings = []
         
-        # Windows paths
-        windows_path_pattern = r"[A-Za-z]:\\(?:[^\\/:*?\"<>|\r\n]+\\)*[^\\/:*?\"<>|\r\n]*"
-        # Unix paths
-        unix_path_pattern = r"/(?:[^/\0]+/)*[^/\0]+"
-        
-        for string in strings:
-            # Check for sensitive paths
-            sensitive_paths = [
-                "/etc/passwd", "/etc/shadow", "/etc/hosts",
-                "C:\\Windows\\System32", "C:\\Windows\\Temp",
-                "/tmp/", "/var/log/", ".ssh/", ".aws/",
-            ]
-            
-            for path_pattern in [windows_path_pattern, unix_path_pattern]:
-                paths = re.findall(path_pattern, string)
-                for path in paths:
-                    if any(sensitive in path.lower() for sensitive in sensitive_paths):
-                        findings.append({
-                            "type": "sensitive_path",
-                            "path": path,
-                            "severity": "medium",
-                            "description": f"Sensitive file path found: {path}",
-                            "location": "strings",
-                        })
+        hits = []
+        
+        # Windows paths, then Unix paths; a regex only runs when the buffer
+        # contains the separator every match of it needs
+        for separator, path_re in [(b":\\", self._win_path_re), (b"/", self._unix_path_re)]:
+            if separator not in binary_data:
+                continue
+            for match in path_re.finditer(binary_data):
+                if match.end() - match.start() < MIN_SENSITIVE_PATH_LENGTH:
+                    continue
+                index = _run_index(runs, match.start())
+                if index < 0:
+                    continue
+                path = match.group()
+                # Check for sensitive paths
+                if self._sensitive_path_re.search(path.lower()):
+                    hits.append((index, path.decode("ascii"), match.start()))
+        
+        # One finding per distinct path
+        for path, group in _group_hits(hits).items():
+            findings.append({
+                "type": "sensitive_path",
+                "path": path,
+                "count": group["count"],
+                "offsets": group["offsets"],
+                "severity": "medium",
+                "description": f"Sensitive file path found: {path}",
+                "location": "strings",
+            })
         
         return findings
     
-    def _check_suspicious(self, strings: List[str]) -> List[Dict[str, Any]]:
+    def _check_suspicious(self, binary_data: bytes, runs: StringRuns) -> List[Dict[str, Any]]:
         """Check for suspicious strings."""
         findings = []
         
-        suspicious_keywords = [
-            "password", "secret", "key", "token", "credential",
-            "backdoor", "trojan", "malware", "exploit",
-            "cmd.exe", "/bin/sh", "powershell",
-        ]
-        
-        for string in strings:
-            lower_string = string.lower()
-            for keyword in suspicious_keywords:
-                if keyword in lower_string:
-                    findings.append({
-                        "type": "suspicious_string",
-                        "keyword": keyword,
-                        "severity": "low",
-                        "description": f"Suspicious keyword found: {keyword}",
-                        "location": "strings",
-                    })
+        matches = (
+            (_run_index(runs, match.start()), match.group(1).decode("ascii"), match.start())
+            for match in self._suspicious_re.finditer(binary_data.lower())
+        )
+        groups = _group_hits(hit for hit in matches if hit[0] >= 0)
+        
+        # One finding per keyword
+        for keyword in SUSPICIOUS_KEYWORDS:
+            if keyword in groups:
+                findings.append({
+                    "type": "suspicious_string",
+                    "keyword": keyword,
+                    "count": groups[keyword]["count"],
+                    "offsets": groups[keyword]["offsets"],
+                    "severity": "low",
+                    "description": f"Suspicious keyword found: {keyword}",
+                    "location": "strings",
+                })
         
         return findings
     
@@ -143,6 +143,10 @@ class Settings(BaseSettings):
     # Multi-region
     region: RegionConfig = Field(default_factory=RegionConfig)
 
+    # Distributed analysis: directory mounted on the scheduler and every worker,
+    # used to hand binaries to chunk tasks without sending them through the broker
+    distributed_shared_dir: Optional[str] = None
+
     # Optional features
     enable_ui: bool = True
     enable_metrics: bool = True
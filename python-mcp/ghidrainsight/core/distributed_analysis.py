@@ -1,6 +1,9 @@
 """Distributed analysis module using Celery for multi-node processing."""
 
+import hashlib
 import logging
+import os
+import tempfile
 from typing import Dict, Any, List, Optional
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -56,6 +59,7 @@ class DistributedAnalysisManager:
             enable_utc=True,
             task_routes={
                 'ghidrainsight.core.distributed_tasks.analyze_binary_chunk': {'queue': 'analysis'},
+                'ghidrainsight.core.distributed_tasks.analyze_binary_batch': {'queue': 'analysis'},
                 'ghidrainsight.core.distributed_tasks.analyze_binary_parallel': {'queue': 'analysis'},
             },
             task_default_queue='analysis',
@@ -79,25 +83,29 @@ class DistributedAnalysisManager:
             from .real_analysis import real_analysis_engine
             return real_analysis_engine.analyze_binary(binary_data, features)
 
+        source = None
         try:
+            # Write the binary once to shared storage; tasks only carry its path
+            source = self._write_shared_binary(binary_data)
+
             # Split binary into chunks
             num_chunks = 4
             chunk_size = len(binary_data) // num_chunks
-            chunks = []
+            chunk_ranges = []
 
             for i in range(num_chunks):
                 start = i * chunk_size
                 end = start + chunk_size if i < num_chunks - 1 else len(binary_data)
-                chunk = binary_data[start:end]
-                chunks.append((chunk, start, features))
+                chunk_ranges.append((start, end - start))
 
-            # Submit distributed tasks
-            from .distributed_tasks import analyze_binary_chunk
+            # Submit distributed tasks; each worker runs every feature over its
+            # chunk in one batch instead of one broker round-trip per feature
+            from .distributed_tasks import analyze_binary_batch
 
             task_results = []
-            for chunk_data, offset, chunk_features in chunks:
+            for chunk_range in chunk_ranges:
                 # Run task asynchronously
-                task = analyze_binary_chunk.delay(chunk_data, offset, chunk_features)
+                task = analyze_binary_batch.delay(source, features, [chunk_range])
                 task_results.append(task)
 
             # Wait for all tasks to complete
@@ -105,7 +113,10 @@ class DistributedAnalysisManager:
             for task in task_results:
                 try:
                     result = task.get(timeout=300)  # 5 minute timeout
-                    completed_results.append(result)
+                    if result.get("success"):
+                        completed_results.extend(result["chunks"])
+                    else:
+                        completed_results.append(result)
                 except Exception as e:
                     logger.error(f"Task failed: {e}")
                     completed_results.append({
@@ -123,6 +134,29 @@ class DistributedAnalysisManager:
             from .real_analysis import real_analysis_engine
             return real_analysis_engine.analyze_binary(binary_data, features)
 
+        finally:
+            if source:
+                try:
+                    os.unlink(source)
+                except OSError as e:
+                    logger.warning(f"Failed to remove shared binary {source}: {e}")
+
+    def _write_shared_binary(self, binary_data: bytes) -> str:
+        """Write binary data to storage shared with the workers and return its path."""
+        shared_dir = settings.distributed_shared_dir
+        if not shared_dir:
+            # A scheduler-local temp dir is invisible to workers on other nodes
+            raise ValueError(
+                "distributed_shared_dir is not set; point GHIDRA_DISTRIBUTED_SHARED_DIR "
+                "at storage mounted on every worker"
+            )
+        os.makedirs(shared_dir, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=shared_dir, prefix='ghidrainsight-',
+                                         suffix='.bin', delete=False) as f:
+            f.write(binary_data)
+            return f.name
+
     async def analyze_parallel_features(self, binary_data: bytes,
                                       features: List[str]) -> Dict[str, Any]:
         """
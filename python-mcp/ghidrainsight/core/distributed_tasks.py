@@ -1,7 +1,10 @@
 """Celery tasks for distributed analysis."""
 
 import logging
-from typing import Dict, Any, List
+import mmap
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Tuple
 
 try:
     from celery import Celery
@@ -19,17 +22,55 @@ if CELERY_AVAILABLE:
 else:
     app = None
 
+# Host stats are sampled at most once per TTL so health-check storms do not
+# turn into psutil syscalls on every call
+_STATS_TTL_SECONDS = 1.0
+_stats_cache: Dict[str, Any] = {"timestamp": 0.0, "stats": None}
+
+
+@contextmanager
+def _map_binary_region(source: str, offset: int, length: int) -> Iterator[memoryview]:
+    """
+    Map a read-only view of length bytes at offset in the shared binary file.
+
+    The view is only valid inside the with block and must not be exported
+    (np.frombuffer, nested memoryviews) past it, or closing the map fails;
+    copy it out with bytes() before handing it to analyzers.
+    """
+    if length <= 0:
+        yield memoryview(b"")
+        return
+
+    # mmap offsets must be a multiple of the allocation granularity
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(source, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), length + offset - aligned, offset=aligned,
+                           access=mmap.ACCESS_READ)
+    try:
+        with memoryview(mapped) as view:
+            with view[offset - aligned:] as region:
+                yield region
+    finally:
+        mapped.close()
+
 
 @app.task(bind=True, name='ghidrainsight.core.distributed_tasks.analyze_binary_chunk')
-def analyze_binary_chunk(self, binary_chunk: bytes, offset: int,
+def analyze_binary_chunk(self, source: str, offset: int, length: int,
                         features: List[str]) -> Dict[str, Any]:
     """
     Analyze a chunk of binary data.
 
-    This task runs on distributed worker nodes.
+    This task runs on distributed worker nodes. The binary is not sent
+    through the broker; source names a file on storage shared with the
+    scheduler and the worker maps only the requested region.
     """
     try:
-        logger.info(f"Analyzing binary chunk at offset {offset}, size {len(binary_chunk)}")
+        logger.info(f"Analyzing binary chunk at offset {offset}, size {length}")
+
+        # Only this chunk is read from the shared file; analyzers get their
+        # own copy so nothing they retain can pin the map
+        with _map_binary_region(source, offset, length) as region:
+            binary_chunk = bytes(region)
 
         # Run analysis on this chunk
         # Note: This is a simplified version - real implementation would need
@@ -38,7 +79,7 @@ def analyze_binary_chunk(self, binary_chunk: bytes, offset: int,
 
         return {
             "offset": offset,
-            "chunk_size": len(binary_chunk),
+            "chunk_size": length,
             "features": features,
             "results": {features[0]: result},
             "success": True
@@ -53,6 +94,59 @@ def analyze_binary_chunk(self, binary_chunk: bytes, offset: int,
         }
 
 
+@app.task(bind=True, name='ghidrainsight.core.distributed_tasks.analyze_binary_batch')
+def analyze_binary_batch(self, source: str, features: List[str],
+                         chunk_ranges: List[Tuple[int, int]]) -> Dict[str, Any]:
+    """
+    Analyze several chunks of a shared binary for several features.
+
+    The worker maps the binary once and loops over chunk_ranges x features
+    itself, so a single broker message replaces one per chunk and feature.
+    """
+    try:
+        logger.info(f"Analyzing {len(chunk_ranges)} binary chunks for features: {features}")
+
+        start = min((offset for offset, _ in chunk_ranges), default=0)
+        end = max((offset + length for offset, length in chunk_ranges), default=0)
+
+        chunks = []
+        with _map_binary_region(source, start, end - start) as binary_region:
+            for offset, length in chunk_ranges:
+                results = {}
+                # Analyzers get a copy of the chunk; a view they retained
+                # (e.g. np.frombuffer) would keep the map from closing
+                with binary_region[offset - start:offset - start + length] as view:
+                    binary_chunk = bytes(view)
+                for feature in features:
+                    try:
+                        results[feature] = analysis_engine._run_feature_analysis(
+                            feature, binary_chunk
+                        )
+                    except Exception as e:
+                        logger.error(f"Feature {feature} analysis failed at offset {offset}: {e}")
+                        results[feature] = {"error": str(e)}
+
+                chunks.append({
+                    "offset": offset,
+                    "chunk_size": length,
+                    "features": features,
+                    "results": results,
+                    "success": True
+                })
+
+        return {
+            "chunks": chunks,
+            "success": True
+        }
+
+    except Exception as e:
+        logger.error(f"Batch analysis failed: {e}")
+        return {
+            "error": str(e),
+            "success": False
+        }
+
+
 @app.task(bind=True, name='ghidrainsight.core.distributed_tasks.analyze_binary_parallel')
 def analyze_binary_parallel(self, binary_data: bytes,
                            features: List[str]) -> Dict[str, Any]:
@@ -99,21 +193,35 @@ def health_check(self) -> Dict[str, Any]:
     }
 
 
+def _sample_host_stats() -> Dict[str, Any]:
+    """Return psutil host statistics, refreshed at most every _STATS_TTL_SECONDS."""
+    now = time.monotonic()
+    if _stats_cache["stats"] is None or now - _stats_cache["timestamp"] > _STATS_TTL_SECONDS:
+        import psutil
+
+        memory = psutil.virtual_memory()
+        _stats_cache["stats"] = {
+            "cpu_count": psutil.cpu_count(),
+            "memory_total": memory.total,
+            "memory_available": memory.available,
+            "disk_usage": psutil.disk_usage('/').percent,
+            "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+        }
+        _stats_cache["timestamp"] = now
+
+    return _stats_cache["stats"]
+
+
 @app.task(bind=True, name='ghidrainsight.core.distributed_tasks.get_worker_stats')
 def get_worker_stats(self) -> Dict[str, Any]:
     """Get statistics from worker node."""
-    import psutil
     import platform
 
     try:
         return {
             "hostname": self.request.hostname,
             "platform": platform.platform(),
-            "cpu_count": psutil.cpu_count(),
-            "memory_total": psutil.virtual_memory().total,
-            "memory_available": psutil.virtual_memory().available,
-            "disk_usage": psutil.disk_usage('/').percent,
-            "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+            **_sample_host_stats()
         }
     except ImportError:
         # psutil not available
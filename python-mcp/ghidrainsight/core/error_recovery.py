@@ -2,11 +2,16 @@
 
 import logging
 import asyncio
+import hashlib
+import random
 import time
-from typing import Dict, Any, List, Callable, Optional, Union
+from array import array
+from typing import Dict, Any, Deque, Iterator, Callable, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 import traceback
+from collections import Counter, deque
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,112 @@ class RecoveryStrategy(Enum):
     ESCALATE = "escalate"
 
 
+# Log level used for each error severity
+_SEVERITY_LOG_LEVEL = {
+    ErrorSeverity.LOW: logging.DEBUG,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL
+}
+
+# Severities whose errors carry a formatted traceback in their context
+_TRACEBACK_SEVERITIES = frozenset({ErrorSeverity.HIGH, ErrorSeverity.CRITICAL})
+
+# (severity, recoverable, strategy, category) for built-in exception classes;
+# subclasses inherit the rule of their nearest listed base. The category names
+# the handler and recovery strategy registered for the error.
+_ERROR_CLASS_RULES = {
+    TimeoutError: (ErrorSeverity.HIGH, True, RecoveryStrategy.RETRY, "timeout"),
+    MemoryError: (ErrorSeverity.CRITICAL, True, RecoveryStrategy.FALLBACK, "memory"),
+    ConnectionError: (ErrorSeverity.MEDIUM, True, RecoveryStrategy.RETRY, "network"),
+}
+
+# Fallback for other exception types, matched against the lowercased class name
+_ERROR_NAME_RULES = (
+    (("timeout",), (ErrorSeverity.HIGH, True, RecoveryStrategy.RETRY, "timeout")),
+    (("memory",), (ErrorSeverity.CRITICAL, True, RecoveryStrategy.FALLBACK, "memory")),
+    (("network", "connection"), (ErrorSeverity.MEDIUM, True, RecoveryStrategy.RETRY, "network")),
+    (("database",), (ErrorSeverity.HIGH, True, RecoveryStrategy.RETRY, "database")),
+)
+
+_DEFAULT_ERROR_RULE = (ErrorSeverity.MEDIUM, False, RecoveryStrategy.ESCALATE, "analysis")
+
+
+def _classify_exception(exception_class: type, error_type: str) -> tuple:
+    """Return (severity, recoverable, strategy, category) for an exception class."""
+    for klass in exception_class.__mro__:
+        rule = _ERROR_CLASS_RULES.get(klass)
+        if rule is not None:
+            return rule
+
+    for needles, rule in _ERROR_NAME_RULES:
+        if any(needle in error_type for needle in needles):
+            return rule
+
+    return _DEFAULT_ERROR_RULE
+
+
+# Seconds a memoized fallback result is reused for the same call
+_FALLBACK_MEMO_TTL = 30.0
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable stand-in for a call argument; raises TypeError if there is none."""
+    # Binaries are keyed by digest so the memo never pins the data itself
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return (len(value), hashlib.blake2b(value, digest_size=16).digest())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def _fallback_key(operation_name: str, args: tuple, kwargs: dict) -> Optional[tuple]:
+    """Build a fallback memo key for a call, or None if its arguments are unhashable."""
+    try:
+        return (operation_name, _freeze(args), _freeze(kwargs))
+    except TypeError:
+        return None
+
+
+def _sleep_decorrelated(prev: float, base: float = 1.0, cap: float = 60.0,
+                        jitter: Callable[[], float] = random.random) -> float:
+    """Return the next retry delay using decorrelated jitter.
+
+    Each delay is drawn from [base, 3 * prev] and capped, so concurrent
+    retriers spread out instead of retrying in lockstep. ``jitter`` supplies
+    the uniform [0, 1) sample.
+    """
+    return min(cap, base + (prev * 3 - base) * jitter())
+
+
+def _decorrelated_schedule(base: float, cap: float) -> Callable[[Callable[[], float]], Iterator[float]]:
+    """Build a retry schedule that yields decorrelated-jitter delays."""
+    def schedule(jitter: Callable[[], float]) -> Iterator[float]:
+        delay = base
+        while True:
+            delay = _sleep_decorrelated(delay, base, cap, jitter)
+            yield delay
+    return schedule
+
+
+# Uniform samples drawn per refill of a manager's jitter buffer
+_JITTER_BUFFER_SIZE = 1024
+
+
+# Retry delay schedules, keyed by the error category they recover from
+_SCHEDULES = {
+    "timeout": _decorrelated_schedule(1.0, 30.0),
+    "network": _decorrelated_schedule(1.0, 60.0),
+    # Database retries stay within a 1-5 second window
+    "database": _decorrelated_schedule(1.0, 5.0),
+}
+
+
 @dataclass
 class AnalysisError:
     """Represents an analysis error with recovery information."""
@@ -35,11 +146,25 @@ class AnalysisError:
     severity: ErrorSeverity
     recoverable: bool
     recovery_strategy: RecoveryStrategy
-    context: Dict[str, Any]
     timestamp: float
+    category: str = ""
+    operation: str = ""
+    args_count: int = 0
+    kwargs_keys: Tuple[str, ...] = ()
+    formatted_traceback: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
 
+    @cached_property
+    def context(self) -> Dict[str, Any]:
+        """Error context, assembled on first access."""
+        return {
+            "operation": self.operation,
+            "args_count": self.args_count,
+            "kwargs_keys": list(self.kwargs_keys),
+            "traceback": self.formatted_traceback
+        }
+
     def should_retry(self) -> bool:
         """Check if error should be retried."""
         return (self.recoverable and
@@ -57,8 +182,22 @@ class ErrorRecoveryManager:
     def __init__(self):
         self.error_handlers: Dict[str, Callable] = {}
         self.recovery_strategies: Dict[str, Callable] = {}
-        self.error_history: List[AnalysisError] = []
         self.max_history_size = 1000
+        # Ring buffer: the oldest error is evicted automatically once full
+        self.error_history: Deque[AnalysisError] = deque(maxlen=self.max_history_size)
+        # Running tallies over error_history, kept in step with it on every append
+        self._type_counts: Counter = Counter()
+        self._severity_counts: Counter = Counter()
+        # Single-slot memo of the last successful fallback, so a call that just
+        # needed one isn't failed and downgraded again during the same outage
+        self._last_fallback_key: Optional[tuple] = None
+        self._last_fallback_value: Any = None
+        self._last_fallback_expiry = 0.0
+        # Private generator whose samples are drawn in blocks and handed out to
+        # retry schedules one at a time
+        self._rng = random.Random()
+        self._jitter_buf = array("d")
+        self._jitter_index = 0
 
         self._setup_default_handlers()
 
@@ -99,23 +238,44 @@ class ErrorRecoveryManager:
         Returns:
             Operation result or fallback result
         """
-        start_time = time.time()
+        # Monotonic event loop clock, immune to wall-clock adjustments
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        # Keys digest the arguments, so only build one while a memoized
+        # fallback is live or once the call has failed
+        fallback_key = None
+        if self._last_fallback_key is not None and start_time < self._last_fallback_expiry:
+            fallback_key = _fallback_key(operation_name, args, kwargs)
+            if fallback_key is not None and fallback_key == self._last_fallback_key:
+                logger.info("Operation %s served from recent fallback", operation_name)
+                return self._last_fallback_value
 
         try:
             result = await operation(*args, **kwargs)
-            logger.info(f"Operation {operation_name} completed successfully")
+            logger.info("Operation %s completed successfully", operation_name)
             return result
 
         except Exception as e:
             error = self._create_error_from_exception(e, operation_name, args, kwargs)
             self._log_error(error)
 
+            # Computed before recovery; fallback strategies rewrite kwargs in place
+            if fallback_key is None:
+                fallback_key = _fallback_key(operation_name, args, kwargs)
+
             # Try recovery
             recovery_result = await self._attempt_recovery(error, operation, args, kwargs)
 
             if recovery_result is not None:
-                execution_time = time.time() - start_time
-                logger.info(f"Operation {operation_name} recovered successfully in {execution_time:.2f}s")
+                if (fallback_key is not None and isinstance(recovery_result, dict) and
+                        recovery_result.get("fallback_applied")):
+                    self._last_fallback_key = fallback_key
+                    self._last_fallback_value = recovery_result
+                    self._last_fallback_expiry = loop.time() + _FALLBACK_MEMO_TTL
+
+                execution_time = loop.time() - start_time
+                logger.info("Operation %s recovered successfully in %.2fs", operation_name, execution_time)
                 return recovery_result
             else:
                 # Recovery failed, re-raise original error
@@ -126,29 +286,17 @@ class ErrorRecoveryManager:
                                    args: tuple,
                                    kwargs: dict) -> AnalysisError:
         """Create AnalysisError from exception."""
-        error_type = type(exception).__name__.lower()
+        exception_class = type(exception)
+        error_type = exception_class.__name__.lower()
 
         # Determine severity and recoverability
-        if "timeout" in error_type:
-            severity = ErrorSeverity.HIGH
-            recoverable = True
-            strategy = RecoveryStrategy.RETRY
-        elif "memory" in error_type:
-            severity = ErrorSeverity.CRITICAL
-            recoverable = True
-            strategy = RecoveryStrategy.FALLBACK
-        elif "network" in error_type or "connection" in error_type:
-            severity = ErrorSeverity.MEDIUM
-            recoverable = True
-            strategy = RecoveryStrategy.RETRY
-        elif "database" in error_type:
-            severity = ErrorSeverity.HIGH
-            recoverable = True
-            strategy = RecoveryStrategy.RETRY
+        severity, recoverable, strategy, category = _classify_exception(exception_class, error_type)
+
+        # Formatting a traceback walks every frame; only keep it where it's worth it
+        if severity in _TRACEBACK_SEVERITIES:
+            formatted_traceback = traceback.format_exc()
         else:
-            severity = ErrorSeverity.MEDIUM
-            recoverable = False
-            strategy = RecoveryStrategy.ESCALATE
+            formatted_traceback = None
 
         return AnalysisError(
             error_type=error_type,
@@ -156,13 +304,13 @@ class ErrorRecoveryManager:
             severity=severity,
             recoverable=recoverable,
             recovery_strategy=strategy,
-            context={
-                "operation": operation_name,
-                "args_count": len(args),
-                "kwargs_keys": list(kwargs.keys()),
-                "traceback": traceback.format_exc()
-            },
-            timestamp=time.time()
+            timestamp=time.time(),
+            category=category,
+            # Plain fields only; the context dict is built if a handler asks for it
+            operation=operation_name,
+            args_count=len(args),
+            kwargs_keys=tuple(kwargs),
+            formatted_traceback=formatted_traceback
         )
 
     async def _attempt_recovery(self, error: AnalysisError,
@@ -173,77 +321,71 @@ class ErrorRecoveryManager:
         if not error.recoverable:
             return None
 
+        # Strategies are registered per error category, not per RecoveryStrategy
         strategy_name = error.recovery_strategy.value
-        strategy_func = self.recovery_strategies.get(strategy_name)
+        strategy_func = self.recovery_strategies.get(error.category)
 
         if not strategy_func:
-            logger.warning(f"No recovery strategy found for {strategy_name}")
+            logger.warning("No recovery strategy found for %s", error.category)
             return None
 
         try:
-            logger.info(f"Attempting recovery for {error.error_type} using {strategy_name}")
+            logger.info("Attempting recovery for %s using %s", error.error_type, strategy_name)
             return await strategy_func(error, operation, args, kwargs)
         except Exception as recovery_error:
-            logger.error(f"Recovery failed for {error.error_type}: {recovery_error}")
+            logger.error("Recovery failed for %s: %s", error.error_type, recovery_error)
             return None
 
-    async def _retry_with_backoff(self, error: AnalysisError,
-                                operation: Callable,
-                                args: tuple,
-                                kwargs: dict) -> Optional[Any]:
-        """Retry operation with exponential backoff."""
+    async def _retry(self, error: AnalysisError,
+                     operation: Callable,
+                     args: tuple,
+                     kwargs: dict,
+                     *, schedule: Callable[[Callable[[], float]], Iterator[float]]) -> Optional[Any]:
+        """Retry operation, sleeping for each delay the schedule yields."""
         if not error.should_retry():
             return None
 
-        base_delay = 1.0
-        max_delay = 30.0
+        delays = schedule(self._next_jitter)
 
         for attempt in range(error.retry_count, error.max_retries):
-            delay = min(base_delay * (2 ** attempt), max_delay)
+            delay = next(delays)
 
-            logger.info(f"Retrying {error.error_type} in {delay}s (attempt {attempt + 1})")
+            logger.info("Retrying %s in %.2fs (attempt %d)", error.error_type, delay, attempt + 1)
             await asyncio.sleep(delay)
 
             try:
                 result = await operation(*args, **kwargs)
-                logger.info(f"Retry successful for {error.error_type}")
+                logger.info("Retry successful for %s", error.error_type)
                 return result
             except Exception as e:
-                logger.warning(f"Retry {attempt + 1} failed: {e}")
+                logger.warning("Retry %d failed: %s", attempt + 1, e)
                 error.increment_retry()
 
         return None
 
+    def _next_jitter(self) -> float:
+        """Return the next uniform [0, 1) sample from the jitter buffer."""
+        if self._jitter_index >= len(self._jitter_buf):
+            rng_random = self._rng.random
+            self._jitter_buf = array("d", [rng_random() for _ in range(_JITTER_BUFFER_SIZE)])
+            self._jitter_index = 0
+        sample = self._jitter_buf[self._jitter_index]
+        self._jitter_index += 1
+        return sample
+
+    async def _retry_with_backoff(self, error: AnalysisError,
+                                operation: Callable,
+                                args: tuple,
+                                kwargs: dict) -> Optional[Any]:
+        """Retry with decorrelated jitter backoff."""
+        return await self._retry(error, operation, args, kwargs, schedule=_SCHEDULES["timeout"])
+
     async def _retry_with_exponential_backoff(self, error: AnalysisError,
                                             operation: Callable,
                                             args: tuple,
                                             kwargs: dict) -> Optional[Any]:
-        """Retry with exponential backoff and jitter."""
-        if not error.should_retry():
-            return None
-
-        import random
-        base_delay = 1.0
-        max_delay = 60.0
-        jitter_factor = 0.1
-
-        for attempt in range(error.retry_count, error.max_retries):
-            delay = min(base_delay * (2 ** attempt), max_delay)
-            jitter = delay * jitter_factor * random.uniform(-1, 1)
-            total_delay = delay + jitter
-
-            logger.info(f"Retrying {error.error_type} in {total_delay:.2f}s (attempt {attempt + 1})")
-            await asyncio.sleep(total_delay)
-
-            try:
-                result = await operation(*args, **kwargs)
-                logger.info(f"Retry successful for {error.error_type}")
-                return result
-            except Exception as e:
-                logger.warning(f"Retry {attempt + 1} failed: {e}")
-                error.increment_retry()
-
-        return None
+        """Retry with decorrelated jitter backoff."""
+        return await self._retry(error, operation, args, kwargs, schedule=_SCHEDULES["network"])
 
     async def _reduce_complexity_fallback(self, error: AnalysisError,
                                         operation: Callable,
@@ -257,7 +399,7 @@ class ErrorRecoveryManager:
                 # Try with fewer features
                 reduced_features = original_features[:len(original_features)//2]
                 kwargs["features"] = reduced_features
-                logger.info(f"Falling back with reduced features: {reduced_features}")
+                logger.info("Falling back with reduced features: %s", reduced_features)
 
                 try:
                     result = await operation(*args, **kwargs)
@@ -268,7 +410,7 @@ class ErrorRecoveryManager:
                         "result": result
                     }
                 except Exception as e:
-                    logger.warning(f"Fallback failed: {e}")
+                    logger.warning("Fallback failed: %s", e)
 
         return None
 
@@ -284,7 +426,7 @@ class ErrorRecoveryManager:
 
             # Replace complex features with simple ones
             kwargs["features"] = simple_features
-            logger.info(f"Falling back to simple analysis: {simple_features}")
+            logger.info("Falling back to simple analysis: %s", simple_features)
 
             try:
                 result = await operation(*args, **kwargs)
@@ -295,7 +437,7 @@ class ErrorRecoveryManager:
                     "result": result
                 }
             except Exception as e:
-                logger.warning(f"Simple analysis fallback failed: {e}")
+                logger.warning("Simple analysis fallback failed: %s", e)
 
         return None
 
@@ -304,91 +446,73 @@ class ErrorRecoveryManager:
                                args: tuple,
                                kwargs: dict) -> Optional[Any]:
         """Retry with jitter to avoid thundering herd."""
-        import random
-
-        if not error.should_retry():
-            return None
-
-        for attempt in range(error.retry_count, error.max_retries):
-            # Jittered delay between 1-5 seconds
-            delay = 1.0 + random.uniform(0, 4.0)
-
-            logger.info(f"Retrying {error.error_type} with jitter in {delay:.2f}s (attempt {attempt + 1})")
-            await asyncio.sleep(delay)
-
-            try:
-                result = await operation(*args, **kwargs)
-                logger.info(f"Jitter retry successful for {error.error_type}")
-                return result
-            except Exception as e:
-                logger.warning(f"Jitter retry {attempt + 1} failed: {e}")
-                error.increment_retry()
-
-        return None
+        return await self._retry(error, operation, args, kwargs, schedule=_SCHEDULES["database"])
 
     def _handle_timeout_error(self, error: AnalysisError) -> None:
         """Handle timeout errors."""
-        logger.warning(f"Timeout error in {error.context.get('operation')}: {error.message}")
+        logger.warning("Timeout error in %s: %s", error.context.get("operation"), error.message)
 
     def _handle_memory_error(self, error: AnalysisError) -> None:
         """Handle memory errors."""
-        logger.error(f"Memory error in {error.context.get('operation')}: {error.message}")
+        logger.error("Memory error in %s: %s", error.context.get("operation"), error.message)
 
     def _handle_network_error(self, error: AnalysisError) -> None:
         """Handle network errors."""
-        logger.warning(f"Network error in {error.context.get('operation')}: {error.message}")
+        logger.warning("Network error in %s: %s", error.context.get("operation"), error.message)
 
     def _handle_analysis_error(self, error: AnalysisError) -> None:
         """Handle analysis errors."""
-        logger.error(f"Analysis error in {error.context.get('operation')}: {error.message}")
+        logger.error("Analysis error in %s: %s", error.context.get("operation"), error.message)
 
     def _handle_database_error(self, error: AnalysisError) -> None:
         """Handle database errors."""
-        logger.error(f"Database error in {error.context.get('operation')}: {error.message}")
+        logger.error("Database error in %s: %s", error.context.get("operation"), error.message)
 
     def _log_error(self, error: AnalysisError) -> None:
         """Log error and add to history."""
-        log_level = {
-            ErrorSeverity.LOW: logging.DEBUG,
-            ErrorSeverity.MEDIUM: logging.WARNING,
-            ErrorSeverity.HIGH: logging.ERROR,
-            ErrorSeverity.CRITICAL: logging.CRITICAL
-        }.get(error.severity, logging.ERROR)
+        log_level = _SEVERITY_LOG_LEVEL.get(error.severity, logging.ERROR)
+
+        logger.log(log_level, "Analysis error: %s - %s", error.error_type, error.message)
 
-        logger.log(log_level, f"Analysis error: {error.error_type} - {error.message}")
+        # Add to history, untallying the entry the ring buffer is about to evict
+        if len(self.error_history) == self.error_history.maxlen:
+            evicted = self.error_history[0]
+            self._untally(self._type_counts, evicted.error_type)
+            self._untally(self._severity_counts, evicted.severity.value)
 
-        # Add to history
         self.error_history.append(error)
-        if len(self.error_history) > self.max_history_size:
-            self.error_history.pop(0)
+        self._type_counts[error.error_type] += 1
+        self._severity_counts[error.severity.value] += 1
+
+    @staticmethod
+    def _untally(counts: Counter, key: str) -> None:
+        """Decrement a tally, dropping the key once it reaches zero."""
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
 
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics."""
         if not self.error_history:
             return {"total_errors": 0}
 
-        error_types = {}
-        severities = {}
-        recoveries = {"successful": 0, "failed": 0}
-
-        for error in self.error_history:
-            error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-            severities[error.severity.value] = severities.get(error.severity.value, 0) + 1
-
-            # Note: In real implementation, track recovery success
-            recoveries["failed"] += 1  # Simplified
+        # Note: In real implementation, track recovery success
+        recoveries = {"successful": 0, "failed": len(self.error_history)}  # Simplified
+        most_common = self._type_counts.most_common(1)
 
         return {
             "total_errors": len(self.error_history),
-            "error_types": error_types,
-            "severities": severities,
+            "error_types": dict(self._type_counts),
+            "severities": dict(self._severity_counts),
             "recovery_stats": recoveries,
-            "most_common_error": max(error_types, key=error_types.get) if error_types else None
+            "most_common_error": most_common[0][0] if most_common else None
         }
 
     def clear_error_history(self) -> None:
         """Clear error history."""
         self.error_history.clear()
+        self._type_counts.clear()
+        self._severity_counts.clear()
 
 
 # Global error recovery manager
@@ -4,14 +4,37 @@ import logging
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import asyncio
+import json
+import ssl
+import time
 import aiohttp
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..config import Settings, RegionConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a replication payload to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """Format a Unix timestamp as a naive UTC ISO 8601 string."""
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None).isoformat()
+
+
 @dataclass
 class RegionStatus:
     """Status of a region."""
@@ -19,8 +42,10 @@ class RegionStatus:
     url: str
     healthy: bool = False
     latency_ms: float = 0.0
-    last_check: Optional[datetime] = None
+    last_check: Optional[float] = None  # Unix timestamp, formatted on read
     error: Optional[str] = None
+    health_url: str = ""
+    replicate_url: str = ""
 
 
 class MultiRegionManager:
@@ -35,13 +60,21 @@ class MultiRegionManager:
         """
         self.config = config
         self.region_config = config.region
+        # Bound once; these are read on every routing and replication call
+        self._enabled = self.region_config.enabled
+        self._current = self.region_config.current_region
+        self._primary = self.region_config.primary_region
+        self._replication_enabled = self.region_config.replication_enabled
         self.regions: Dict[str, RegionStatus] = {}
         self._session: Optional[aiohttp.ClientSession] = None
+        # Lowest-latency healthy region, recomputed only after health changes
+        self._best_region: Optional[str] = None
+        self._best_region_stale = True
         self._initialize_regions()
     
     def _initialize_regions(self) -> None:
         """Initialize region status tracking."""
-        if not self.region_config.enabled:
+        if not self._enabled:
             return
         
         for region in self.region_config.regions:
@@ -50,7 +83,9 @@ class MultiRegionManager:
             self.regions[region] = RegionStatus(
                 region=region,
                 url=url,
-                healthy=False
+                healthy=False,
+                health_url=f"{url}/health",
+                replicate_url=f"{url}/api/replicate"
             )
     
     def _get_region_url(self, region: str) -> str:
@@ -61,8 +96,19 @@ class MultiRegionManager:
     
     async def initialize(self) -> None:
         """Initialize HTTP session."""
-        if self.region_config.enabled:
+        if self._enabled:
+            # One keep-alive pool for every region, so repeated health checks and
+            # replication calls reuse TCP+TLS connections and cached DNS lookups.
+            # The SSL context is built once and pinned on the connector.
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                ssl=ssl.create_default_context(),
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=aiohttp.ClientTimeout(total=self.region_config.cross_region_timeout)
             )
     
@@ -82,20 +128,38 @@ class MultiRegionManager:
         Returns:
             True if region is healthy
         """
+        healthy = await self._probe_region(region)
+        # Marked after the probe so a routing call made mid-probe can't clear it early
+        self._best_region_stale = True
+        return healthy
+    
+    async def _probe_region(self, region: str) -> bool:
+        """Probe a region's health endpoint and record the result."""
         if not self._session or region not in self.regions:
             return False
         
         region_status = self.regions[region]
+        
+        # This process is serving the current region, so it is healthy by definition
+        # and reachable without a network hop; its zero latency makes routing
+        # prefer it over every remote region
+        if region == self._current:
+            region_status.healthy = True
+            region_status.latency_ms = 0.0
+            region_status.last_check = time.time()
+            region_status.error = None
+            return True
+        
         start_time = asyncio.get_event_loop().time()
         
         try:
-            async with self._session.get(f"{region_status.url}/health") as response:
+            async with self._session.get(region_status.health_url) as response:
                 latency = (asyncio.get_event_loop().time() - start_time) * 1000
                 
                 if response.status == 200:
                     region_status.healthy = True
                     region_status.latency_ms = latency
-                    region_status.last_check = datetime.utcnow()
+                    region_status.last_check = time.time()
                     region_status.error = None
                     return True
                 else:
@@ -113,44 +177,55 @@ class MultiRegionManager:
     
     async def check_all_regions(self) -> Dict[str, bool]:
         """Check health of all regions."""
-        if not self.region_config.enabled:
+        if not self._enabled:
             return {}
         
-        tasks = {
-            region: self.check_region_health(region)
-            for region in self.regions.keys()
-        }
-        
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        # Seeded in region order; each check writes its own entry when it finishes
+        results = dict.fromkeys(self.regions, False)
+        await asyncio.gather(*(
+            self._check_and_store(region, results)
+            for region in self.regions
+        ))
+        self._refresh_best_region()
         
-        return {
-            region: result if isinstance(result, bool) else False
-            for region, result in zip(tasks.keys(), results)
-        }
+        return results
+    
+    async def _check_and_store(self, region: str, results: Dict[str, bool]) -> None:
+        """Check one region and record its health in results."""
+        try:
+            results[region] = await self.check_region_health(region)
+        except Exception as e:
+            logger.warning(f"Region {region} health check raised: {e}")
+            results[region] = False
+    
+    def _refresh_best_region(self) -> None:
+        """Recompute the cached lowest-latency healthy region (the current one once checked)."""
+        self._best_region = min(
+            (region for region, status in self.regions.items() if status.healthy),
+            key=lambda region: self.regions[region].latency_ms,
+            default=None
+        )
+        self._best_region_stale = False
     
     def get_best_region(self) -> Optional[str]:
         """
         Get the best region based on health and latency.
         
+        Once health has been checked the current region always wins, since it
+        is served locally; remote regions are ranked by measured latency only
+        when the current region is not in the configured region list.
+        
         Returns:
             Best region name or None
         """
-        if not self.region_config.enabled:
-            return self.region_config.current_region
+        if not self._enabled:
+            return self._current
         
-        healthy_regions = [
-            (region, status.latency_ms)
-            for region, status in self.regions.items()
-            if status.healthy
-        ]
+        if self._best_region_stale:
+            self._refresh_best_region()
         
-        if not healthy_regions:
-            # Fallback to current region
-            return self.region_config.current_region
-        
-        # Return region with lowest latency
-        best_region, _ = min(healthy_regions, key=lambda x: x[1])
-        return best_region
+        # Fallback to current region when no region is healthy
+        return self._best_region or self._current
     
     async def replicate_to_region(self, region: str, data: Dict[str, Any]) -> bool:
         """
@@ -163,7 +238,17 @@ class MultiRegionManager:
         Returns:
             True if successful
         """
-        if not self.region_config.replication_enabled:
+        try:
+            body = _encode_json(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Replication payload for {region} is not serializable: {e}")
+            return False
+        
+        return await self._replicate_bytes(region, body)
+    
+    async def _replicate_bytes(self, region: str, body: bytes) -> bool:
+        """Send an already serialized JSON payload to a region."""
+        if not self._replication_enabled:
             return False
         
         if region not in self.regions:
@@ -178,9 +263,12 @@ class MultiRegionManager:
         
         try:
             async with self._session.post(
-                f"{region_status.url}/api/replicate",
-                json=data,
-                headers={"X-Region": self.region_config.current_region}
+                region_status.replicate_url,
+                data=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Region": self._current,
+                }
             ) as response:
                 if response.status == 200:
                     logger.info(f"Replicated data to {region}")
@@ -203,14 +291,28 @@ class MultiRegionManager:
         Returns:
             Dictionary mapping region to success status
         """
-        if not self.region_config.replication_enabled:
+        if not self._replication_enabled:
             return {}
         
-        results = {}
-        for region in self.region_config.replication_regions:
-            results[region] = await self.replicate_to_region(region, data)
+        regions = self.region_config.replication_regions
         
-        return results
+        # Serialize the payload once and send the same bytes to every region
+        try:
+            body = _encode_json(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Replication payload is not serializable: {e}")
+            return {region: False for region in regions}
+        
+        # Replicate to every region concurrently; total latency is the slowest region
+        outcomes = await asyncio.gather(
+            *(self._replicate_bytes(region, body) for region in regions),
+            return_exceptions=True
+        )
+        
+        return {
+            region: outcome is True
+            for region, outcome in zip(regions, outcomes)
+        }
     
     def get_region_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all regions."""
@@ -218,7 +320,7 @@ class MultiRegionManager:
             region: {
                 "healthy": status.healthy,
                 "latency_ms": status.latency_ms,
-                "last_check": status.last_check.isoformat() if status.last_check else None,
+                "last_check": _format_timestamp(status.last_check),
                 "error": status.error,
             }
             for region, status in self.regions.items()
@@ -226,10 +328,10 @@ class MultiRegionManager:
     
     def is_current_region_primary(self) -> bool:
         """Check if current region is primary."""
-        if not self.region_config.enabled:
+        if not self._enabled:
             return True
         
         return (
-            self.region_config.primary_region is None or
-            self.region_config.current_region == self.region_config.primary_region
+            self._primary is None or
+            self._current == self._primary
         )
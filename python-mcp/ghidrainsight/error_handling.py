@@ -3,6 +3,7 @@
 import logging
 import traceback
 import sys
+import time
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
 from datetime import datetime
@@ -215,8 +216,6 @@ def retry_on_failure(
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             """Sync wrapper with retry logic."""
-            import time
-            
             last_exception = None
             
             for attempt in range(max_retries + 1):
@@ -361,7 +360,6 @@ class CircuitBreaker:
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt to reset."""
-        import time
         return (
             self.state == "OPEN" and
             self.last_failure_time and
@@ -375,7 +373,6 @@ class CircuitBreaker:
     
     def _on_failure(self):
         """Handle failed operation."""
-        import time
         self.failure_count += 1
         self.last_failure_time = time.time()
         
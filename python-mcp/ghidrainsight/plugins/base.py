@@ -1,10 +1,13 @@
 """Base classes for GhidraInsight plugins."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class AnalysisResult:
@@ -84,6 +87,25 @@ class BaseAnalyzer(ABC):
         """Configure plugin with settings."""
         self.config.update(config)
     
+    def _uint8_view(self, binary_data: bytes, context: Optional[Dict[str, Any]] = None) -> "np.ndarray":
+        """
+        Return a uint8 NumPy view of binary_data, shared through context.
+        
+        Analyzers run with the same context reuse one view instead of each
+        wrapping the buffer again. A cached view is only reused when it is
+        backed by this exact bytes object, so a context passed along with a
+        different binary never serves stale data.
+        """
+        # NumPy is optional (the "ml" extra); only analyzers calling this need it
+        import numpy as np
+        
+        arr = context.get("np_view") if context else None
+        if arr is None or arr.base is not binary_data:
+            arr = np.frombuffer(binary_data, dtype=np.uint8)
+            if context is not None:
+                context["np_view"] = arr
+        return arr
+    
     def _create_result(
         self,
         findings: List[Dict[str, Any]],
@@ -72,16 +72,20 @@ class PluginLoader:
             List of loaded plugins
         """
         dir_path = Path(directory) if directory else self.plugin_dir
-        if not dir_path.exists():
+        try:
+            # scandir entries carry their file type, so filtering needs no extra stat calls
+            with os.scandir(dir_path) as entries:
+                plugin_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+                ]
+        except FileNotFoundError:
             logger.warning(f"Plugin directory does not exist: {dir_path}")
             return []
         
         plugins = []
-        for file_path in dir_path.glob("*.py"):
-            if file_path.name.startswith("_"):
-                continue
-            
-            plugin = self.load_from_file(str(file_path))
+        for file_path in plugin_files:
+            plugin = self.load_from_file(file_path)
             if plugin:
                 plugins.append(plugin)
         
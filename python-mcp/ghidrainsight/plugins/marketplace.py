@@ -1,20 +1,219 @@
 """Plugin marketplace for discovering and installing community plugins."""
 
+import asyncio
+import email.utils
+import functools
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from datetime import datetime
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .registry import PluginRegistry
 from .loader import PluginLoader
 
 logger = logging.getLogger(__name__)
 
+# Search responses kept on disk for conditional requests
+MAX_CACHED_SEARCHES = 32
+
+# Age after which the prefetched plugin index is refreshed in the background
+CACHE_TTL_SECONDS = 3600
+
+# How long a cold-start lookup waits for the first background refresh
+INDEX_WAIT_SECONDS = 10.0
+
+# Minimum gap between background refresh attempts, so an unreachable
+# marketplace is not retried on every lookup
+REFRESH_RETRY_SECONDS = 60.0
+
+# Slotted dataclasses need Python 3.10; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Unauthenticated GitHub search allows 10 requests per minute
+API_REQUESTS_PER_MINUTE = 10
+
+# Longest a request waits for the rate limiter before giving up
+MAX_RATE_LIMIT_WAIT = 60.0
+
+# Retries after a 429 and the backoff used when it has no Retry-After; the
+# same as the sync session's urllib3 Retry
+MAX_RATE_LIMIT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+
+# Concurrent requests allowed through the async session
+MAX_CONCURRENT_REQUESTS = 10
+
+# Headers sent with every marketplace request
+_REQUEST_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "ghidrainsight",
+}
+
+# Bytes copied per read when streaming a plugin download to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Search qualifier selecting marketplace plugins, and the suffix added to a user query
+_TOPIC_QUALIFIER = "topic:ghidrainsight-plugin"
+_TOPIC_SUFFIX = " " + _TOPIC_QUALIFIER
+
+# Raw download URL of a plugin file: repository URL, branch, plugin name
+_RAW_URL_FMT = "{}/raw/{}/{}.py"
+
+# Repository fields a marketplace plugin is built from; GitHub sends ~80 per item
+_REPO_FIELDS = ("name", "html_url", "description", "topics", "stargazers_count", "default_branch")
+
+
+def _project_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the fields _parse_github_repo reads out of a GitHub search item."""
+    owner = repo.get("owner") or {}
+    projected = {key: repo[key] for key in _REPO_FIELDS if key in repo}
+    projected["owner"] = {key: owner[key] for key in ("login", "type") if key in owner}
+    return projected
+
+
+@functools.lru_cache(maxsize=1024)
+def _plugin_fields(repo_name: str, html_url: str, branch: str,
+                   topics: Tuple[str, ...]) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Derive a plugin's name, download URL and tags from repository fields.
+    
+    Memoized so a repository seen again across searches skips the string
+    work; callers build a fresh MarketplacePlugin from the result.
+    """
+    # Look for plugin metadata in repository
+    # This is a simplified version - real implementation would check for metadata file
+    name = repo_name.replace("ghidrainsight-", "").replace("-plugin", "")
+    
+    # Try to get plugin.py or similar; the search payload already names the
+    # default branch, so no per-repository lookup is needed to resolve it
+    download_url = _RAW_URL_FMT.format(html_url, branch, name)
+    
+    # Extract tags from topics
+    tags = tuple(t for t in topics if t != "ghidrainsight-plugin")
+    
+    return name, download_url, tags
+
+
+def _build_tag_index(plugins: List["MarketplacePlugin"]) -> Dict[str, List["MarketplacePlugin"]]:
+    """Map each tag to the plugins carrying it, preserving plugin order."""
+    by_tag: Dict[str, List[MarketplacePlugin]] = defaultdict(list)
+    for plugin in plugins:
+        for tag in plugin.tags:
+            by_tag[tag].append(plugin)
+    return dict(by_tag)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
-@dataclass
+def _retry_after(headers: Any, attempt: int) -> float:
+    """Seconds to wait before retrying a 429, from Retry-After or exponential backoff."""
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return RETRY_BACKOFF_FACTOR * 2 ** attempt
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace path with data so readers never see a partially written file."""
+    # A uniquely named sibling keeps concurrent writers, in this or another
+    # process, from interleaving; os.replace then swaps it in atomically
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class TokenBucket:
+    """Blocking token bucket that paces outgoing API requests."""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the largest allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, max_wait: float = MAX_RATE_LIMIT_WAIT) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            
+            if wait > max_wait:
+                raise RuntimeError(f"Rate limit exhausted; next request allowed in {wait:.0f}s")
+            time.sleep(wait)
+    
+    def sync(self, remaining: int, reset_in: float) -> None:
+        """Align the bucket with a server-reported remaining quota."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if remaining < self._tokens:
+                self._tokens = remaining
+            if remaining == 0 and reset_in > 0:
+                # Nothing left until the window resets; hold off until then
+                self._tokens = min(self._tokens, 1 - reset_in * self.rate)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MarketplacePlugin:
     """Plugin information from marketplace."""
     name: str
@@ -27,6 +226,7 @@ class MarketplacePlugin:
     rating: float = 0.0
     tags: List[str] = None
     verified: bool = False
+    sha256: Optional[str] = None  # Expected digest of the download, when published
     
     def __post_init__(self):
         if self.tags is None:
@@ -36,19 +236,148 @@ class MarketplacePlugin:
 class PluginMarketplace:
     """Marketplace for discovering and installing plugins."""
     
-    def __init__(self, marketplace_url: Optional[str] = None, cache_dir: Optional[str] = None):
+    def __init__(self, marketplace_url: Optional[str] = None, cache_dir: Optional[str] = None,
+                 index_url: Optional[str] = None):
         """
         Initialize plugin marketplace.
         
         Args:
             marketplace_url: URL to marketplace API (default: GitHub-based)
             cache_dir: Directory to cache plugin metadata
+            index_url: URL of the published plugin manifest used to list all plugins
         """
         self.marketplace_url = marketplace_url or "https://api.github.com/search/repositories"
+        self.index_url = index_url or "https://ghidrainsight.github.io/marketplace/index.json"
         self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".ghidrainsight" / "marketplace"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.registry = PluginRegistry()
         self.loader = PluginLoader()
+        
+        # Parsed search results with their ETags, keyed by search query; an
+        # unchanged result comes back as an empty 304 and is served from here
+        self._search_cache_file = self.cache_dir / "search_cache.json"
+        self._search_cache = self._load_search_cache()
+        
+        # One pooled keep-alive session for every marketplace request, so
+        # repeated calls skip the TCP and TLS handshakes
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=MAX_RATE_LIMIT_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR,
+                              status_forcelist=[429, 502, 503, 504])
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(_REQUEST_HEADERS)
+        
+        # Async counterpart, created on first use inside the running event loop
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._aio_semaphore: Optional[asyncio.Semaphore] = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Smooths bursts of API calls so they stay under GitHub's rate limit
+        self._bucket = TokenBucket(rate=API_REQUESTS_PER_MINUTE / 60, capacity=API_REQUESTS_PER_MINUTE)
+        
+        # In-memory plugin index, prefetched from the local cache and kept
+        # fresh by a background refresh started on the first lookup, so
+        # browsing never waits on GitHub
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_attempted = 0.0
+        self._index, self._index_updated = self._load_cache()
+        self._by_tag = _build_tag_index(self._index)
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session; search API calls are paced by the rate limiter."""
+        # The bucket is sized for the search API, so downloads bypass it
+        if url != self.marketplace_url:
+            return self._session.get(url, **kwargs)
+        
+        self._bucket.acquire()
+        response = self._session.get(url, **kwargs)
+        self._sync_rate_limit(response.headers)
+        return response
+    
+    async def _aio(self) -> aiohttp.ClientSession:
+        """Return the async session for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._aio_session is None or self._aio_session.closed or self._aio_loop is not loop:
+            await self._drop_aio_session()
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+                headers=_REQUEST_HEADERS,
+            )
+            self._aio_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._aio_loop = loop
+        return self._aio_session
+    
+    async def _drop_aio_session(self) -> None:
+        """Close a session left over from an earlier event loop."""
+        session = self._aio_session
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except RuntimeError:
+            # Its loop is already closed, and its connections with it
+            session.detach()
+    
+    @asynccontextmanager
+    async def _aget(self, url: str, timeout: float, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Async GET through the shared session; search API calls are paced by the rate limiter."""
+        session = await self._aio()
+        paced = url == self.marketplace_url
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            async with self._aio_semaphore:
+                if paced:
+                    await asyncio.to_thread(self._bucket.acquire)
+                async with session.get(url, timeout=client_timeout, **kwargs) as response:
+                    if paced:
+                        self._sync_rate_limit(response.headers)
+                    
+                    # Like the sync session's urllib3 Retry, wait out a 429 instead
+                    # of failing, unless the server asks for too long a pause
+                    delay = None
+                    if response.status == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                        delay = _retry_after(response.headers, attempt)
+                    if delay is None or delay > MAX_RATE_LIMIT_WAIT:
+                        yield response
+                        return
+            
+            logger.debug(f"Rate limited by {url}; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    def _sync_rate_limit(self, headers: Any) -> None:
+        """Follow GitHub's own view of the remaining quota."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            try:
+                self._bucket.sync(int(remaining), float(reset) - time.time())
+            except ValueError:
+                pass
+    
+    def close(self) -> None:
+        """Close the HTTP session."""
+        # Let an in-flight background refresh finish with the session first
+        refresh = self._refresh_thread
+        if refresh is not None:
+            refresh.join(INDEX_WAIT_SECONDS)
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP session."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    def __enter__(self) -> "PluginMarketplace":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     def search(self, query: str, tags: Optional[List[str]] = None) -> List[MarketplacePlugin]:
         """
@@ -62,40 +391,206 @@ class PluginMarketplace:
             List of matching plugins
         """
         try:
-            # Search GitHub for plugins with topic "ghidrainsight-plugin"
-            params = {
-                "q": f"{query} topic:ghidrainsight-plugin",
-                "sort": "stars",
-                "order": "desc"
-            }
+            # Listing everything comes from the static manifest, which has no
+            # rate limit; the search API is only needed when it is unavailable
+            if not query:
+                found = self._fetch_manifest()
+                if found is not None:
+                    return self._select(found, tags, listing=True)
             
-            response = requests.get(self.marketplace_url, params=params, timeout=10)
-            response.raise_for_status()
+            params, headers, cached = self._search_request(query)
             
-            results = response.json()
-            plugins = []
+            response = self._get(self.marketplace_url, params=params, headers=headers, timeout=10)
+            status = response.status_code
+            if status >= 400:
+                logger.error(f"Failed to search marketplace: HTTP {status}")
+                return []
             
-            for repo in results.get("items", [])[:20]:  # Limit to top 20
-                plugin = self._parse_github_repo(repo)
-                if plugin:
-                    # Filter by tags if provided
-                    if tags and not any(tag in plugin.tags for tag in tags):
-                        continue
-                    plugins.append(plugin)
+            # A 304 carries no body; _search_results serves it from the search cache
+            found = self._search_results(
+                params["q"], cached, status, response.content, response.headers.get("ETag")
+            )
+            return self._select(found, tags, listing=not query)
+            
+        except Exception as e:
+            logger.error(f"Failed to search marketplace: {e}")
+            return []
+    
+    async def asearch(self, query: str, tags: Optional[List[str]] = None) -> List[MarketplacePlugin]:
+        """Search for plugins in marketplace without blocking the event loop."""
+        try:
+            if not query:
+                found = await self._afetch_manifest()
+                if found is not None:
+                    return self._select(found, tags, listing=True)
+            
+            params, headers, cached = self._search_request(query)
             
-            return plugins
+            async with self._aget(self.marketplace_url, 10, params=params, headers=headers) as response:
+                status = response.status
+                if status >= 400:
+                    logger.error(f"Failed to search marketplace: HTTP {status}")
+                    return []
+                content = await response.read()
+                etag = response.headers.get("ETag")
+            
+            found = self._search_results(params["q"], cached, status, content, etag)
+            return self._select(found, tags, listing=not query)
             
         except Exception as e:
             logger.error(f"Failed to search marketplace: {e}")
             return []
     
+    def _fetch_manifest(self) -> Optional[List[MarketplacePlugin]]:
+        """Fetch every plugin from the published manifest, or None if it is unavailable."""
+        try:
+            # Not the GitHub API, so it bypasses the rate limiter
+            response = self._session.get(self.index_url, timeout=10)
+            if response.status_code >= 400:
+                logger.debug(f"No plugin manifest at {self.index_url}: HTTP {response.status_code}")
+                return None
+            return self._parse_manifest(response.content)
+        except Exception as e:
+            logger.debug(f"Failed to fetch plugin manifest: {e}")
+            return None
+    
+    async def _afetch_manifest(self) -> Optional[List[MarketplacePlugin]]:
+        """Async counterpart of _fetch_manifest."""
+        try:
+            session = await self._aio()
+            async with self._aio_semaphore:
+                async with session.get(self.index_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status >= 400:
+                        logger.debug(f"No plugin manifest at {self.index_url}: HTTP {response.status}")
+                        return None
+                    content = await response.read()
+            return self._parse_manifest(content)
+        except Exception as e:
+            logger.debug(f"Failed to fetch plugin manifest: {e}")
+            return None
+    
+    def _parse_manifest(self, content: bytes) -> List[MarketplacePlugin]:
+        """Parse a manifest (same layout as plugins.json), most installed first."""
+        plugins = [MarketplacePlugin(**data) for data in _json_loads(content).get("plugins", [])]
+        plugins.sort(key=lambda p: p.install_count, reverse=True)
+        return plugins
+    
+    def _search_request(self, query: str) -> Tuple[Dict[str, str], Optional[Dict[str, str]], Optional[Dict[str, Any]]]:
+        """Build search parameters, conditional headers and the cached entry for a query."""
+        # Search GitHub for plugins with topic "ghidrainsight-plugin"
+        params = {
+            "q": query + _TOPIC_SUFFIX if query else _TOPIC_QUALIFIER,
+            "sort": "stars",
+            "order": "desc"
+        }
+        
+        cached = self._search_cache.get(params["q"])
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        return params, headers, cached
+    
+    def _search_results(self, query: str, cached: Optional[Dict[str, Any]], status: int,
+                        content: bytes, etag: Optional[str]) -> List[MarketplacePlugin]:
+        """Turn a search response into plugins, updating the search cache."""
+        if status == 304 and cached:
+            # Unchanged since the last search; reuse the parsed results
+            found = [MarketplacePlugin(**data) for data in cached["plugins"]]
+        else:
+            # Keep only the fields a plugin is built from, so the rest of the
+            # (large) decoded payload can be freed before parsing
+            repos = [
+                _project_repo(repo)
+                for repo in _json_loads(content).get("items", [])[:20]  # Limit to top 20
+            ]
+            found = []
+            
+            for repo in repos:
+                plugin = self._parse_github_repo(repo)
+                if plugin:
+                    found.append(plugin)
+            
+            if etag:
+                self._store_search(query, etag, found)
+        
+        return found
+    
+    def _select(self, found: List[MarketplacePlugin], tags: Optional[List[str]],
+                listing: bool = False) -> List[MarketplacePlugin]:
+        """Update the index with plugins and return those matching tags."""
+        # A full listing is authoritative, so plugins missing from it are
+        # dropped; keyword search results only add to what is known
+        if listing:
+            self._replace_index(found)
+        else:
+            self._merge_index(found)
+        
+        # Filter by tags if provided; one hashed lookup per plugin tag
+        if tags:
+            tag_set = frozenset(tags)
+            return [plugin for plugin in found if not tag_set.isdisjoint(plugin.tags)]
+        return found
+    
     def get_popular(self, limit: int = 10) -> List[MarketplacePlugin]:
         """Get popular plugins."""
-        return self.search("", tags=None)[:limit]
+        return self._current_index()[:limit]
     
     def get_by_tag(self, tag: str) -> List[MarketplacePlugin]:
         """Get plugins by tag."""
-        return self.search("", tags=[tag])
+        self._current_index()
+        return list(self._by_tag.get(tag, ()))
+    
+    def _current_index(self) -> List[MarketplacePlugin]:
+        """Return the in-memory index, scheduling a refresh when it is stale."""
+        self._refresh_index_if_stale()
+        
+        # Cold start: give a running refresh a moment rather than racing it;
+        # if it failed the index stays empty until the next attempt
+        refresh = self._refresh_thread
+        if not self._index and refresh is not None and refresh.is_alive():
+            refresh.join(INDEX_WAIT_SECONDS)
+        
+        return self._index
+    
+    def _is_cache_fresh(self, ttl_sec: float = CACHE_TTL_SECONDS) -> bool:
+        """Check whether the index was refreshed within ttl_sec."""
+        return bool(self._index) and time.time() - self._index_updated < ttl_sec
+    
+    def _refresh_index_if_stale(self) -> None:
+        """Start a background update_cache() unless the index is fresh or one was tried recently."""
+        now = time.time()
+        if self._is_cache_fresh() or now - self._refresh_attempted < REFRESH_RETRY_SECONDS:
+            return
+        
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            # Recorded up front so a failed refresh also waits out the retry gap
+            self._refresh_attempted = now
+            self._refresh_thread = threading.Thread(
+                target=self.update_cache, name="marketplace-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+    
+    def _replace_index(self, plugins: List[MarketplacePlugin]) -> None:
+        """Make plugins the whole index, ordered by popularity."""
+        if not plugins:
+            return
+        
+        index = sorted(plugins, key=lambda p: p.install_count, reverse=True)
+        with self._lock:
+            self._by_tag = _build_tag_index(index)
+            self._index = index
+    
+    def _merge_index(self, plugins: List[MarketplacePlugin]) -> None:
+        """Union plugins into the index, keeping it ordered by popularity."""
+        if not plugins:
+            return
+        
+        with self._lock:
+            merged = {plugin.repository: plugin for plugin in self._index}
+            merged.update((plugin.repository, plugin) for plugin in plugins)
+            index = sorted(merged.values(), key=lambda p: p.install_count, reverse=True)
+            self._by_tag = _build_tag_index(index)
+            self._index = index
     
     def install(self, plugin: MarketplacePlugin, install_dir: Optional[str] = None) -> bool:
         """
@@ -109,48 +604,104 @@ class PluginMarketplace:
             True if installed successfully
         """
         try:
-            install_path = Path(install_dir) if install_dir else Path("./plugins")
-            install_path.mkdir(parents=True, exist_ok=True)
+            plugin_file = self._install_target(plugin, install_dir)
+            if plugin_file is None:
+                return False
             
-            # Download plugin file
-            if plugin.download_url.endswith(".py"):
-                response = requests.get(plugin.download_url, timeout=30)
-                response.raise_for_status()
-                
-                plugin_file = install_path / f"{plugin.name}.py"
-                plugin_file.write_text(response.text)
-                
-                # Load and register plugin
-                loaded_plugin = self.loader.load_from_file(str(plugin_file))
-                if loaded_plugin:
-                    logger.info(f"Installed plugin: {plugin.name} v{plugin.version}")
-                    return True
-                else:
-                    logger.error(f"Failed to load installed plugin: {plugin.name}")
-                    plugin_file.unlink()  # Clean up
+            # Stream straight to disk in chunks instead of buffering and decoding
+            # the body, hashing each chunk on the way through
+            digest = hashlib.sha256()
+            with self._get(plugin.download_url, stream=True, timeout=30) as response:
+                if response.status_code >= 400:
+                    logger.error(f"Failed to download plugin {plugin.name}: HTTP {response.status_code}")
                     return False
-            else:
-                logger.error(f"Unsupported plugin format: {plugin.download_url}")
+                try:
+                    with open(plugin_file, "wb") as f:
+                        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
+                except Exception:
+                    plugin_file.unlink(missing_ok=True)
+                    raise
+            
+            return self._finish_install(plugin, plugin_file, digest)
+                
+        except Exception as e:
+            logger.error(f"Failed to install plugin {plugin.name}: {e}")
+            return False
+    
+    async def ainstall(self, plugin: MarketplacePlugin, install_dir: Optional[str] = None) -> bool:
+        """Install a plugin from marketplace without blocking the event loop on the download."""
+        try:
+            plugin_file = self._install_target(plugin, install_dir)
+            if plugin_file is None:
                 return False
+            
+            digest = hashlib.sha256()
+            async with self._aget(plugin.download_url, 30) as response:
+                if response.status >= 400:
+                    logger.error(f"Failed to download plugin {plugin.name}: HTTP {response.status}")
+                    return False
+                try:
+                    with open(plugin_file, "wb") as f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
+                except Exception:
+                    plugin_file.unlink(missing_ok=True)
+                    raise
+            
+            return self._finish_install(plugin, plugin_file, digest)
                 
         except Exception as e:
             logger.error(f"Failed to install plugin {plugin.name}: {e}")
             return False
     
+    def _install_target(self, plugin: MarketplacePlugin, install_dir: Optional[str]) -> Optional[Path]:
+        """Return the file a plugin installs to, or None if its format is unsupported."""
+        install_path = Path(install_dir) if install_dir else Path("./plugins")
+        install_path.mkdir(parents=True, exist_ok=True)
+        
+        if not plugin.download_url.endswith(".py"):
+            logger.error(f"Unsupported plugin format: {plugin.download_url}")
+            return None
+        
+        return install_path / f"{plugin.name}.py"
+    
+    def _finish_install(self, plugin: MarketplacePlugin, plugin_file: Path, digest: Any) -> bool:
+        """Verify and load a downloaded plugin file, removing it on failure."""
+        # Refuse a download that doesn't match its published digest
+        if plugin.sha256 and digest.hexdigest() != plugin.sha256.lower():
+            logger.error(f"Checksum mismatch for plugin {plugin.name}: got {digest.hexdigest()}")
+            plugin_file.unlink()
+            return False
+        
+        # Load and register plugin
+        loaded_plugin = self.loader.load_from_file(str(plugin_file))
+        if loaded_plugin:
+            logger.info(f"Installed plugin: {plugin.name} v{plugin.version}")
+            return True
+        else:
+            logger.error(f"Failed to load installed plugin: {plugin.name}")
+            plugin_file.unlink()  # Clean up
+            return False
+    
     def uninstall(self, plugin_name: str, plugin_dir: Optional[str] = None) -> bool:
         """Uninstall a plugin."""
         try:
             plugin_path = Path(plugin_dir) if plugin_dir else Path("./plugins")
             plugin_file = plugin_path / f"{plugin_name}.py"
             
-            if plugin_file.exists():
+            # A single unlink; no separate existence check to race against
+            try:
                 plugin_file.unlink()
-                self.registry.unregister(plugin_name)
-                logger.info(f"Uninstalled plugin: {plugin_name}")
-                return True
-            else:
+            except FileNotFoundError:
                 logger.warning(f"Plugin file not found: {plugin_file}")
                 return False
+            
+            self.registry.unregister(plugin_name)
+            logger.info(f"Uninstalled plugin: {plugin_name}")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to uninstall plugin {plugin_name}: {e}")
@@ -163,60 +714,110 @@ class PluginMarketplace:
     def _parse_github_repo(self, repo: Dict[str, Any]) -> Optional[MarketplacePlugin]:
         """Parse GitHub repository into MarketplacePlugin."""
         try:
-            # Look for plugin metadata in repository
-            # This is a simplified version - real implementation would check for metadata file
-            name = repo.get("name", "").replace("ghidrainsight-", "").replace("-plugin", "")
-            
-            # Try to get plugin.py or similar
-            download_url = f"{repo['html_url']}/raw/main/{name}.py"
-            
-            # Extract tags from topics
-            tags = repo.get("topics", [])
-            tags = [t for t in tags if t != "ghidrainsight-plugin"]
+            name, download_url, tags = _plugin_fields(
+                repo.get("name", ""),
+                repo["html_url"],
+                repo.get("default_branch") or "main",
+                tuple(repo.get("topics", [])),
+            )
             
             return MarketplacePlugin(
                 name=name,
                 version="1.0.0",  # Would parse from metadata
                 author=repo.get("owner", {}).get("login", "unknown"),
                 description=repo.get("description", ""),
-                repository=repo.get("html_url", ""),
+                repository=repo["html_url"],
                 download_url=download_url,
                 install_count=repo.get("stargazers_count", 0),
                 rating=0.0,  # Would calculate from reviews
-                tags=tags,
+                tags=list(tags),
                 verified=repo.get("owner", {}).get("type") == "Organization"
             )
         except Exception as e:
             logger.debug(f"Failed to parse repository: {e}")
             return None
     
+    def _load_cache(self) -> Tuple[List[MarketplacePlugin], float]:
+        """Load the plugin index and its update time from the local cache."""
+        cache_file = self.cache_dir / "plugins.json"
+        try:
+            cache_data = _json_loads(cache_file.read_bytes())
+            plugins = [MarketplacePlugin(**data) for data in cache_data["plugins"]]
+            updated = datetime.fromisoformat(cache_data["updated"]).replace(tzinfo=timezone.utc)
+            return plugins, updated.timestamp()
+        except FileNotFoundError:
+            return [], 0.0
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable plugin cache: {e}")
+            return [], 0.0
+    
+    def _load_search_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached search results from disk."""
+        try:
+            return _json_loads(self._search_cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable search cache: {e}")
+            return {}
+    
+    def _store_search(self, query: str, etag: str, plugins: List[MarketplacePlugin]) -> None:
+        """Remember a search result and its ETag for conditional requests."""
+        # The background index refresh may search at the same time
+        with self._lock:
+            self._search_cache.pop(query, None)
+            self._search_cache[query] = {
+                "etag": etag,
+                "plugins": [asdict(p) for p in plugins],
+            }
+            # Evict the least recently stored queries
+            while len(self._search_cache) > MAX_CACHED_SEARCHES:
+                del self._search_cache[next(iter(self._search_cache))]
+            
+            try:
+                _atomic_write(self._search_cache_file, _json_dumps(self._search_cache))
+            except OSError as e:
+                logger.debug(f"Failed to write search cache: {e}")
+    
     def update_cache(self) -> None:
         """Update local plugin cache."""
         try:
-            popular = self.get_popular(limit=50)
-            cache_file = self.cache_dir / "plugins.json"
-            
-            cache_data = {
-                "updated": datetime.utcnow().isoformat(),
-                "plugins": [
-                    {
-                        "name": p.name,
-                        "version": p.version,
-                        "author": p.author,
-                        "description": p.description,
-                        "repository": p.repository,
-                        "download_url": p.download_url,
-                        "install_count": p.install_count,
-                        "rating": p.rating,
-                        "tags": p.tags,
-                        "verified": p.verified
-                    }
-                    for p in popular
-                ]
-            }
+            # Fetch the full listing (manifest first, search API as fallback);
+            # search() makes that listing the new index
+            plugins = self.search("", tags=None)
+            if not plugins:
+                logger.warning("Marketplace returned no plugins; keeping the existing cache")
+                return
             
-            cache_file.write_text(json.dumps(cache_data, indent=2))
-            logger.info(f"Updated plugin cache: {len(popular)} plugins")
+            self._write_index_cache(plugins)
             
         except Exception as e:
             logger.error(f"Failed to update cache: {e}")
+    
+    async def aupdate_cache(self) -> None:
+        """Update local plugin cache without blocking the event loop on GitHub."""
+        try:
+            plugins = await self.asearch("", tags=None)
+            if not plugins:
+                logger.warning("Marketplace returned no plugins; keeping the existing cache")
+                return
+            
+            self._write_index_cache(plugins)
+            
+        except Exception as e:
+            logger.error(f"Failed to update cache: {e}")
+    
+    def _write_index_cache(self, plugins: List[MarketplacePlugin]) -> None:
+        """Write the most popular plugins of a full listing to the local cache."""
+        # Only the listing is persisted, never plugins merged in by keyword searches
+        popular = sorted(plugins, key=lambda p: p.install_count, reverse=True)[:50]
+        cache_file = self.cache_dir / "plugins.json"
+        
+        cache_data = {
+            "updated": datetime.utcnow().isoformat(),
+            "plugins": [asdict(p) for p in popular]
+        }
+        
+        _atomic_write(cache_file, _json_dumps(cache_data))
+        self._index_updated = time.time()
+        logger.info(f"Updated plugin cache: {len(popular)} plugins")
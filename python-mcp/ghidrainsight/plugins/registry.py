@@ -1,6 +1,6 @@
 """Plugin registry for managing custom analyzers."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import logging
 from .base import BaseAnalyzer
 
@@ -0,0 +1,234 @@
+"""Tests for error recovery."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from ghidrainsight.core import error_recovery
+from ghidrainsight.core.error_recovery import ErrorRecoveryManager, RecoveryStrategy
+
+
+class DatabaseError(Exception):
+    """Classified by name as a database error."""
+
+
+class AnalysisFailure(Exception):
+    """Not a recoverable error category."""
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(error_recovery.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def flaky(failures, exception=TimeoutError):
+    """An operation that raises for its first `failures` calls, then returns the call count."""
+    calls = []
+
+    async def operation(*args, **kwargs):
+        calls.append((args, dict(kwargs)))
+        if len(calls) <= failures:
+            raise exception("boom")
+        return len(calls)
+
+    operation.calls = calls
+    return operation
+
+
+def make_error(manager, exception):
+    """Classify exception the way execute_with_recovery does."""
+    return manager._create_error_from_exception(exception, "op", (), {})
+
+
+class TestRetry:
+    """Test the shared retry helper."""
+
+    async def test_succeeds_after_failures(self, sleeps):
+        manager = ErrorRecoveryManager()
+        error = make_error(manager, DatabaseError("locked"))
+        operation = flaky(2, DatabaseError)
+
+        result = await manager._retry(
+            error, operation, (), {}, schedule=error_recovery._SCHEDULES["database"]
+        )
+        assert result == 3
+        assert error.retry_count == 2
+        assert len(sleeps) == 3
+
+    async def test_gives_up_after_max_retries(self, sleeps):
+        manager = ErrorRecoveryManager()
+        error = make_error(manager, TimeoutError("slow"))
+        operation = flaky(10)
+
+        assert await manager._retry_with_backoff(error, operation, (), {}) is None
+        assert len(operation.calls) == error.max_retries
+        assert error.retry_count == error.max_retries
+        assert not error.should_retry()
+
+    async def test_resumes_from_retry_count(self, sleeps):
+        manager = ErrorRecoveryManager()
+        error = make_error(manager, ConnectionError("reset"))
+        error.retry_count = 2
+        operation = flaky(10, ConnectionError)
+
+        assert await manager._retry_with_exponential_backoff(error, operation, (), {}) is None
+        assert len(operation.calls) == 1
+        assert error.retry_count == 3
+
+    async def test_non_retry_strategy_is_not_retried(self, sleeps):
+        manager = ErrorRecoveryManager()
+        error = make_error(manager, MemoryError())
+        assert error.recovery_strategy == RecoveryStrategy.FALLBACK
+        operation = flaky(0)
+
+        assert await manager._retry_with_jitter(error, operation, (), {}) is None
+        assert operation.calls == [] and sleeps == []
+
+    @pytest.mark.parametrize("category,cap", [
+        ("timeout", 30.0),
+        ("network", 60.0),
+        ("database", 5.0),
+    ])
+    def test_delay_bounds(self, category, cap):
+        manager = ErrorRecoveryManager()
+        delays = error_recovery._SCHEDULES[category](manager._next_jitter)
+        # Enough draws to refill the jitter buffer at least once
+        samples = [next(delays) for _ in range(2 * error_recovery._JITTER_BUFFER_SIZE + 1)]
+        assert all(1.0 <= delay <= cap for delay in samples)
+        assert max(samples) > min(samples)
+
+    async def test_database_retry_delays(self, sleeps):
+        manager = ErrorRecoveryManager()
+        for _ in range(200):
+            error = make_error(manager, DatabaseError("locked"))
+            await manager._retry_with_jitter(error, flaky(10, DatabaseError), (), {})
+        assert len(sleeps) == 200 * 3
+        assert all(1.0 <= delay <= 5.0 for delay in sleeps)
+
+
+class TestRecoveryRouting:
+    """Test that errors reach the strategy registered for their category."""
+
+    @pytest.mark.parametrize("exception,category", [
+        (TimeoutError, "timeout"),
+        (ConnectionError, "network"),
+        (DatabaseError, "database"),
+    ])
+    async def test_retry_categories(self, sleeps, exception, category):
+        manager = ErrorRecoveryManager()
+        operation = flaky(1, exception)
+        assert await manager.execute_with_recovery(operation, "op") == 2
+        assert len(sleeps) == 1
+        assert manager.error_history[-1].category == category
+
+    async def test_memory_error_falls_back(self):
+        manager = ErrorRecoveryManager()
+
+        async def operation(features):
+            if len(features) > 1:
+                raise MemoryError("too big")
+            return features
+
+        result = await manager.execute_with_recovery(operation, "op", features=["a", "b"])
+        assert result["fallback_applied"]
+        assert result["result"] == ["a"]
+
+    async def test_unrecoverable_error_is_raised(self):
+        manager = ErrorRecoveryManager()
+        with pytest.raises(AnalysisFailure):
+            await manager.execute_with_recovery(flaky(1, AnalysisFailure), "op")
+
+
+class TestFallbackMemo:
+    """Test reuse of a recent fallback result."""
+
+    @staticmethod
+    def memory_bound():
+        calls = []
+
+        async def operation(data, features):
+            calls.append(list(features))
+            if len(features) > 1:
+                raise MemoryError("too big")
+            return features
+
+        operation.calls = calls
+        return operation
+
+    async def test_reused_within_ttl(self):
+        manager = ErrorRecoveryManager()
+        operation = self.memory_bound()
+
+        first = await manager.execute_with_recovery(operation, "op", b"binary", features=["a", "b"])
+        assert first["fallback_applied"]
+        assert manager._last_fallback_key is not None
+        assert len(operation.calls) == 2
+
+        again = await manager.execute_with_recovery(
+            operation, "op", bytearray(b"binary"), features=("a", "b")
+        )
+        assert again is first
+        assert len(operation.calls) == 2
+
+    async def test_different_call_not_served(self):
+        manager = ErrorRecoveryManager()
+        operation = self.memory_bound()
+        await manager.execute_with_recovery(operation, "op", b"binary", features=["a", "b"])
+
+        other = await manager.execute_with_recovery(operation, "op", b"other", features=["a", "b"])
+        assert other["fallback_applied"]
+        assert len(operation.calls) == 4
+
+    async def test_expires_after_ttl(self, monkeypatch):
+        monkeypatch.setattr(error_recovery, "_FALLBACK_MEMO_TTL", 0.0)
+        manager = ErrorRecoveryManager()
+        operation = self.memory_bound()
+
+        await manager.execute_with_recovery(operation, "op", b"binary", features=["a", "b"])
+        await manager.execute_with_recovery(operation, "op", b"binary", features=["a", "b"])
+        assert len(operation.calls) == 4
+
+
+class TestErrorStatistics:
+    """Test the running error tallies."""
+
+    def test_tallies_follow_evictions(self):
+        manager = ErrorRecoveryManager()
+        size = manager.max_history_size
+        for exception in [TimeoutError()] * 600 + [DatabaseError()] * size:
+            manager._log_error(make_error(manager, exception))
+
+        stats = manager.get_error_statistics()
+        assert stats["total_errors"] == size
+        assert stats["error_types"] == {"databaseerror": size}
+        assert stats["severities"] == {"high": size}
+        assert stats["most_common_error"] == "databaseerror"
+
+    def test_tallies_match_history(self):
+        manager = ErrorRecoveryManager()
+        exceptions = [TimeoutError(), ConnectionError(), DatabaseError(), AnalysisFailure()]
+        rng = random.Random(7)
+        for _ in range(manager.max_history_size + 250):
+            manager._log_error(make_error(manager, rng.choice(exceptions)))
+
+        history = list(manager.error_history)
+        stats = manager.get_error_statistics()
+        assert stats["total_errors"] == len(history) == manager.max_history_size
+        assert stats["error_types"] == dict(Counter(e.error_type for e in history))
+        assert stats["severities"] == dict(Counter(e.severity.value for e in history))
+
+    def test_clear(self):
+        manager = ErrorRecoveryManager()
+        manager._log_error(make_error(manager, TimeoutError()))
+        manager.clear_error_history()
+        assert manager.get_error_statistics() == {"total_errors": 0}
+        manager._log_error(make_error(manager, ConnectionError()))
+        assert manager.get_error_statistics()["error_types"] == {"connectionerror": 1}
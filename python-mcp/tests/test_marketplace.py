@@ -0,0 +1,342 @@
+"""Tests for the plugin marketplace, with GitHub replaced by a fake session."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from ghidrainsight.plugins import marketplace as marketplace_module
+from ghidrainsight.plugins.marketplace import (
+    PluginMarketplace,
+    TokenBucket,
+    _atomic_write,
+)
+
+INDEX_URL = "https://example.invalid/index.json"
+
+
+def make_response(status_code=200, payload=None, headers=None):
+    """A requests-like response carrying a JSON payload."""
+    content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return SimpleNamespace(status_code=status_code, content=content, headers=headers or {})
+
+
+def make_repo(name, stars, topics=("ghidrainsight-plugin",)):
+    """A GitHub search item for a plugin repository."""
+    return {
+        "name": f"ghidrainsight-{name}-plugin",
+        "html_url": f"https://github.com/example/{name}",
+        "description": f"The {name} plugin",
+        "topics": list(topics),
+        "stargazers_count": stars,
+        "default_branch": "main",
+        "owner": {"login": "example", "type": "User"},
+    }
+
+
+def make_manifest(entries):
+    """A published plugin manifest listing (name, install count, tags) entries."""
+    return {"plugins": [
+        {"name": name, "version": "1.0.0", "author": "example", "description": "",
+         "repository": f"https://github.com/example/{name}", "download_url": "",
+         "install_count": stars, "tags": list(tags)}
+        for name, stars, tags in entries
+    ]}
+
+
+class FakeSession:
+    """Stands in for requests.Session, answering each URL from a queue of responses."""
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        queue = self.responses.get(url)
+        if not queue:
+            raise ConnectionError(f"offline: {url}")
+        return queue.pop(0)
+
+    def close(self):
+        pass
+
+    def urls(self):
+        return [url for url, _ in self.calls]
+
+
+def make_marketplace(tmp_path, session):
+    """A marketplace caching under tmp_path and talking to session."""
+    market = PluginMarketplace(cache_dir=str(tmp_path), index_url=INDEX_URL)
+    market._session.close()
+    market._session = session
+    return market
+
+
+class FakeAioSession:
+    """Stands in for aiohttp.ClientSession, replaying (status, payload, headers) responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    @asynccontextmanager
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        status, payload, headers = self.responses.pop(0)
+        content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+
+        async def read():
+            return content
+
+        yield SimpleNamespace(status=status, headers=headers, read=read)
+
+
+def make_async_marketplace(tmp_path, session, monkeypatch):
+    """A marketplace whose async requests go to session, recording sleeps instead of waiting."""
+    market = PluginMarketplace(cache_dir=str(tmp_path), index_url=INDEX_URL)
+
+    async def aio():
+        return session
+
+    market._aio = aio
+    market._aio_semaphore = asyncio.Semaphore(1)
+    market.sleeps = []
+
+    async def fake_sleep(delay):
+        market.sleeps.append(delay)
+
+    monkeypatch.setattr(marketplace_module.asyncio, "sleep", fake_sleep)
+    return market
+
+
+class FakeClock:
+    """Replaces the time module so the token bucket can be driven without sleeping."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(marketplace_module, "time", fake)
+    return fake
+
+
+class TestTokenBucket:
+    """Test request pacing."""
+
+    def test_burst_then_paced(self, clock):
+        bucket = TokenBucket(rate=2.0, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_wait_beyond_max_wait_raises(self, clock):
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        bucket.acquire()
+        with pytest.raises(RuntimeError):
+            bucket.acquire(max_wait=5)
+        assert clock.sleeps == []
+
+    def test_sync_lowers_tokens(self, clock):
+        bucket = TokenBucket(rate=1.0, capacity=10)
+        bucket.sync(remaining=1, reset_in=60)
+        bucket.acquire()
+        assert clock.sleeps == []
+
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_sync_exhausted_waits_for_reset(self, clock):
+        bucket = TokenBucket(rate=1.0, capacity=10)
+        bucket.sync(remaining=0, reset_in=30)
+        bucket.acquire(max_wait=60)
+        assert sum(clock.sleeps) == pytest.approx(30.0)
+
+        bucket.sync(remaining=0, reset_in=120)
+        with pytest.raises(RuntimeError):
+            bucket.acquire(max_wait=60)
+
+
+class TestAtomicWrite:
+    """Test cache file replacement."""
+
+    def test_replaces_file(self, tmp_path):
+        path = tmp_path / "plugins.json"
+        _atomic_write(path, b"first")
+        _atomic_write(path, b"second")
+        assert path.read_bytes() == b"second"
+        assert [p.name for p in tmp_path.iterdir()] == ["plugins.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        path = tmp_path / "plugins.json"
+        _atomic_write(path, b"original")
+        with pytest.raises(TypeError):
+            _atomic_write(path, "not bytes")
+        assert path.read_bytes() == b"original"
+        assert [p.name for p in tmp_path.iterdir()] == ["plugins.json"]
+
+
+class TestConditionalSearch:
+    """Test ETag revalidation of search results."""
+
+    def test_not_modified_served_from_cache(self, tmp_path):
+        api = "https://api.github.com/search/repositories"
+        payload = {"items": [make_repo("alpha", 5, ("ghidrainsight-plugin", "crypto"))]}
+        session = FakeSession({api: [
+            make_response(200, payload, {"ETag": '"v1"'}),
+            make_response(304),
+        ]})
+        market = make_marketplace(tmp_path, session)
+
+        first = market.search("alpha")
+        assert [p.name for p in first] == ["alpha"]
+        assert first[0].tags == ["crypto"]
+        assert session.calls[0][1]["headers"] is None
+
+        second = market.search("alpha")
+        assert second == first
+        assert session.calls[1][1]["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_etag_persists_across_instances(self, tmp_path):
+        api = "https://api.github.com/search/repositories"
+        payload = {"items": [make_repo("alpha", 5)]}
+        make_marketplace(tmp_path, FakeSession({api: [
+            make_response(200, payload, {"ETag": '"v1"'}),
+        ]})).search("alpha")
+
+        session = FakeSession({api: [make_response(304)]})
+        market = make_marketplace(tmp_path, session)
+        assert [p.name for p in market.search("alpha")] == ["alpha"]
+        assert session.calls[0][1]["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_listing_prefers_manifest(self, tmp_path):
+        manifest = make_manifest([("low", 1, []), ("high", 9, [])])
+        session = FakeSession({INDEX_URL: [make_response(200, manifest)]})
+        market = make_marketplace(tmp_path, session)
+
+        assert [p.name for p in market.search("")] == ["high", "low"]
+        assert session.urls() == [INDEX_URL]
+
+    def test_listing_falls_back_to_search_api(self, tmp_path):
+        api = "https://api.github.com/search/repositories"
+        session = FakeSession({
+            INDEX_URL: [make_response(404)],
+            api: [make_response(200, {"items": [make_repo("alpha", 5)]})],
+        })
+        market = make_marketplace(tmp_path, session)
+
+        assert [p.name for p in market.search("")] == ["alpha"]
+        assert session.urls() == [INDEX_URL, api]
+
+
+class TestAsyncRateLimited:
+    """Test that async requests wait out a 429."""
+
+    async def test_retries_after_retry_after(self, tmp_path, monkeypatch):
+        session = FakeAioSession([
+            (429, None, {"Retry-After": "2"}),
+            (429, None, {}),
+            (200, {"items": [make_repo("alpha", 5)]}, {}),
+        ])
+        market = make_async_marketplace(tmp_path, session, monkeypatch)
+
+        assert [p.name for p in await market.asearch("alpha")] == ["alpha"]
+        assert market.sleeps == [2.0, pytest.approx(0.6)]
+        assert session.calls == 3
+
+    async def test_gives_up_on_long_retry_after(self, tmp_path, monkeypatch):
+        session = FakeAioSession([(429, None, {"Retry-After": "3600"})])
+        market = make_async_marketplace(tmp_path, session, monkeypatch)
+
+        assert await market.asearch("alpha") == []
+        assert market.sleeps == []
+
+    async def test_gives_up_after_max_retries(self, tmp_path, monkeypatch):
+        retries = marketplace_module.MAX_RATE_LIMIT_RETRIES
+        session = FakeAioSession([(429, None, {"Retry-After": "1"})] * (retries + 1))
+        market = make_async_marketplace(tmp_path, session, monkeypatch)
+
+        assert await market.asearch("alpha") == []
+        assert market.sleeps == [1.0] * retries
+        assert session.calls == retries + 1
+
+    def test_retry_after_http_date(self, clock):
+        headers = {"Retry-After": "Thu, 01 Jan 1970 00:17:00 GMT"}
+        assert marketplace_module._retry_after(headers, 0) == pytest.approx(20.0)
+
+
+class TestPrefetchedIndex:
+    """Test browsing from the locally cached index."""
+
+    def write_cache(self, tmp_path):
+        manifest = make_manifest([("alpha", 5, ["crypto"]), ("beta", 9, ["crypto", "strings"])])
+        make_marketplace(tmp_path, FakeSession({
+            INDEX_URL: [make_response(200, manifest)],
+        })).update_cache()
+
+    def test_fresh_cache_needs_no_network(self, tmp_path):
+        self.write_cache(tmp_path)
+        session = FakeSession()
+        market = make_marketplace(tmp_path, session)
+
+        assert [p.name for p in market.get_popular()] == ["beta", "alpha"]
+        assert [p.name for p in market.get_by_tag("crypto")] == ["beta", "alpha"]
+        assert market.get_by_tag("missing") == []
+        assert market._refresh_thread is None
+        assert session.calls == []
+
+    def test_offline_cold_start_retries_later(self, tmp_path):
+        session = FakeSession()
+        market = make_marketplace(tmp_path, session)
+
+        assert market.get_popular() == []
+        market._refresh_thread.join()
+        attempts = len(session.calls)
+        assert attempts > 0
+
+        assert market.get_by_tag("crypto") == []
+        assert len(session.calls) == attempts
+
+    def test_full_refresh_drops_removed_plugins(self, tmp_path):
+        api = "https://api.github.com/search/repositories"
+        before = make_manifest([("old", 9, ["crypto"]), ("keep", 5, ["crypto"])])
+        session = FakeSession({
+            INDEX_URL: [
+                make_response(200, before),
+                make_response(200, make_manifest([("keep", 5, ["crypto"])])),
+            ],
+            api: [make_response(200, {"items": [make_repo("extra", 7, ("crypto",))]})],
+        })
+        market = make_marketplace(tmp_path, session)
+
+        market.update_cache()
+        assert [p.name for p in market._index] == ["old", "keep"]
+
+        # Keyword results join the in-memory index but are not persisted
+        market.search("extra")
+        assert [p.name for p in market._index] == ["old", "extra", "keep"]
+
+        market.update_cache()
+        assert [p.name for p in market._index] == ["keep"]
+        assert [p.name for p in market._by_tag["crypto"]] == ["keep"]
+        cached = json.loads((tmp_path / "plugins.json").read_bytes())
+        assert [p["name"] for p in cached["plugins"]] == ["keep"]
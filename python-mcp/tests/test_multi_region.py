@@ -0,0 +1,68 @@
+"""Tests for multi-region routing."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from ghidrainsight.config import RegionConfig, Settings
+from ghidrainsight.core.multi_region import MultiRegionManager
+
+CURRENT = "us-east-1"
+
+
+class FakeSession:
+    """Answers health checks with a fixed status after a per-region delay."""
+
+    def __init__(self, delays, status=200):
+        self.delays = delays
+        self.status = status
+        self.urls = []
+
+    @asynccontextmanager
+    async def get(self, url):
+        self.urls.append(url)
+        region = url.split("ghidrainsight-", 1)[1].split(".", 1)[0]
+        await asyncio.sleep(self.delays.get(region, 0.0))
+        yield SimpleNamespace(status=self.status)
+
+
+def make_manager(regions, session):
+    settings = Settings(
+        jwt_secret="test_secret_key_that_is_long_enough_for_testing",
+        region=RegionConfig(enabled=True, current_region=CURRENT, regions=regions),
+    )
+    manager = MultiRegionManager(settings)
+    manager._session = session
+    return manager
+
+
+class TestBestRegion:
+    """Test region selection."""
+
+    async def test_current_region_preferred(self):
+        session = FakeSession({"eu-west-1": 0.0, "ap-south-1": 0.0})
+        manager = make_manager([CURRENT, "eu-west-1", "ap-south-1"], session)
+
+        assert await manager.check_all_regions() == dict.fromkeys(manager.regions, True)
+        assert manager.get_best_region() == CURRENT
+        # The current region is never probed over HTTP
+        assert not any(CURRENT in url for url in session.urls)
+        assert len(session.urls) == 2
+
+    async def test_remote_regions_ranked_by_latency(self):
+        session = FakeSession({"eu-west-1": 0.05, "ap-south-1": 0.0})
+        manager = make_manager(["eu-west-1", "ap-south-1"], session)
+
+        await manager.check_all_regions()
+        assert manager.get_best_region() == "ap-south-1"
+
+        manager.regions["ap-south-1"].healthy = False
+        await manager.check_region_health("eu-west-1")
+        assert manager.get_best_region() == "eu-west-1"
+
+    async def test_falls_back_to_current_region(self):
+        manager = make_manager(["eu-west-1", "ap-south-1"], FakeSession({}, status=503))
+
+        assert manager.get_best_region() == CURRENT
+        assert await manager.check_all_regions() == {"eu-west-1": False, "ap-south-1": False}
+        assert manager.get_best_region() == CURRENT